@@ -1,28 +1,31 @@
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Query, Request, Response
 
+from app.evaluation.queue import evaluation_queue
+from app.evaluation.store import score_store
+from app.models.profile import REPORT_PROFILES
 from app.models.request import AnalyzeRequest
-from app.models.response import AnalyzeResponse
+from app.models.response import AnalyzeResponse, QualitySummary
 from app.orchestrator.agent import orchestrate
+from app.profiling.store import trace_store
+from app.profiling.trace import Trace, profiled, span
+from app.reports.store import StoredReport, report_store
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-@router.post("/analyze", response_model=AnalyzeResponse)
-def analyze(request: AnalyzeRequest) -> AnalyzeResponse:
-    """
-    Trigger a full market analysis for a product in a given market.
-
-    Orchestrates three tools in sequence:
-    1. Web Scraper (mocked) — pricing, competitors, reviews
-    2. Sentiment Analyzer (LLM) — structured review insights
-    3. Report Generator (LLM) — strategic intelligence report
-    """
+def _run_analysis(request: AnalyzeRequest) -> AnalyzeResponse:
     try:
-        result = orchestrate(request.product_name, request.market)
-        return AnalyzeResponse(**result)
+        result = orchestrate(
+            request.product_name,
+            request.market,
+            deadline_ms=request.deadline_ms,
+            profile=REPORT_PROFILES[request.profile],
+        )
+        with span("validate"):
+            return AnalyzeResponse(**result)
     except ValueError as exc:
         raise HTTPException(status_code=422, detail=str(exc)) from exc
     except Exception as exc:
@@ -31,3 +34,165 @@ def analyze(request: AnalyzeRequest) -> AnalyzeResponse:
             status_code=500,
             detail="Analysis pipeline failed. Check server logs for details.",
         ) from exc
+
+
+@router.post("/analyze", responses={200: {"model": AnalyzeResponse}})
+def analyze(
+    request: AnalyzeRequest,
+    background_tasks: BackgroundTasks,
+    profile_run: bool = Query(False, alias="profile", description="Record per-stage timing spans"),
+    cprofile: bool = Query(False, description="With profile=1, also capture process-wide cProfile stats"),
+    ttft: bool = Query(False, description="With profile=1, stream LLM calls to measure time-to-first-token"),
+) -> Response:
+    """
+    Trigger a full market analysis for a product in a given market.
+
+    Orchestrates three tools in sequence:
+    1. Web Scraper (mocked) — pricing, competitors, reviews
+    2. Sentiment Analyzer (LLM) — structured review insights
+    3. Report Generator (LLM) — strategic intelligence report
+
+    With `deadline_ms`, slow stages are served from cache or omitted;
+    `delivery` in the response says which path was taken. `profile` limits
+    the run to the sections that profile needs.
+
+    A sample of complete analyses (JUDGE_SAMPLE_RATE) is queued for quality
+    scoring after the response is sent.
+
+    With `?profile=1`, stage and sub-step timings are returned in the
+    Server-Timing header and the full trace is available at
+    /profiles/{X-Profile-Id}. `cprofile=1` adds cProfile stats, one request
+    at a time; `ttft=1` measures time-to-first-token by streaming, in which
+    case `deadline_ms` no longer bounds each LLM call as a whole.
+
+    The validated response is serialized once and stored, so /reports can
+    serve it again without re-running or re-validating anything.
+    """
+    headers: dict[str, str] = {}
+    if not profile_run:
+        analysis = _run_analysis(request)
+    else:
+        trace: Trace | None = None
+        try:
+            with profiled(with_cprofile=cprofile, measure_ttft=ttft) as trace:
+                analysis = _run_analysis(request)
+        finally:
+            if trace is not None:
+                trace_store.add(trace)
+        headers["Server-Timing"] = trace.server_timing()
+        headers["X-Profile-Id"] = trace.id
+        if trace.cprofile_status is not None:
+            headers["X-Profile-CProfile"] = trace.cprofile_status
+
+    body = analysis.model_dump_json().encode()
+    if analysis.analysis_id is not None:
+        stored = StoredReport.build(analysis.analysis_id, request.product_name, request.market, request.profile, body)
+        # Only complete analyses become the "latest" report dashboards poll for
+        report_store.add(stored, latest=analysis.delivery == "complete")
+        headers["ETag"] = stored.etag
+
+    # The serialized body is passed as-is and only parsed if the analysis is sampled
+    background_tasks.add_task(evaluation_queue.maybe_enqueue, request.product_name, request.market, body)
+    # Returned as a Response so FastAPI does not validate the model a second time
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@router.get("/quality", response_model=list[QualitySummary])
+def quality() -> list[dict]:
+    """Rolling LLM-as-judge averages per prompt version, model and report profile."""
+    return score_store.averages()
+
+
+@router.get("/quality/{analysis_id}")
+def quality_for_analysis(analysis_id: str) -> dict:
+    """Judge scores for one analysis, if it was sampled and has been scored."""
+    record = score_store.get(analysis_id)
+    if record is None:
+        raise HTTPException(status_code=404, detail=f"No quality score for analysis '{analysis_id}'")
+    return record
+
+
+def _get_trace(trace_id: str) -> Trace:
+    trace = trace_store.get(trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail=f"No profile '{trace_id}'")
+    return trace
+
+
+@router.get("/profiles/{trace_id}")
+def profile_summary(trace_id: str) -> dict:
+    """Spans (and cProfile stats, if captured) for a request made with ?profile=1."""
+    return _get_trace(trace_id).summary()
+
+
+@router.get("/profiles/{trace_id}/chrome-trace")
+def profile_chrome_trace(trace_id: str) -> dict:
+    """The same spans as a Chrome trace, to open in chrome://tracing or Perfetto."""
+    return _get_trace(trace_id).chrome_trace()
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """True if gzip is acceptable; an explicit `gzip` entry takes precedence over `*`."""
+    qualities: dict[str, float] = {}
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        q = 1.0
+        if params.strip().lower().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        qualities[name.strip().lower()] = q
+    return qualities.get("gzip", qualities.get("*", 0.0)) > 0
+
+
+def _serve_stored(stored: StoredReport, request: Request) -> Response:
+    """Serve a stored report with conditional GET and gzip, without touching Pydantic."""
+    use_gzip = stored.gzip_body is not None and _accepts_gzip(request.headers.get("accept-encoding", ""))
+    headers = {
+        "ETag": stored.gzip_etag if use_gzip else stored.etag,
+        "Cache-Control": "no-cache",
+        "Vary": "Accept-Encoding",
+    }
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison, as RFC 9110 requires for If-None-Match
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        # Only the representation chosen for this request counts, so the 304
+        # carries the ETag the client has cached for it
+        if "*" in tags or headers["ETag"] in tags:
+            return Response(status_code=304, headers=headers)
+
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=stored.gzip_body, media_type="application/json", headers=headers)
+    return Response(content=stored.body, media_type="application/json", headers=headers)
+
+
+@router.get("/reports/latest/{product_name}/{market}", responses={200: {"model": AnalyzeResponse}})
+def latest_report(
+    product_name: str,
+    market: str,
+    request: Request,
+    report_profile: str = Query("full", description="Report profile, as in the /analyze request body"),
+) -> Response:
+    """
+    Latest complete stored analysis for a product and market.
+
+    Never runs the pipeline. Supports If-None-Match (304) and gzip, so
+    dashboards can poll it cheaply.
+    """
+    stored = report_store.latest(product_name, market, report_profile)
+    if stored is None:
+        raise HTTPException(status_code=404, detail=f"No stored report for '{product_name}' in {market} ({report_profile})")
+    return _serve_stored(stored, request)
+
+
+@router.get("/reports/{analysis_id}", responses={200: {"model": AnalyzeResponse}})
+def stored_report(analysis_id: str, request: Request) -> Response:
+    """A stored analysis by id, with the same caching behaviour as /reports/latest."""
+    stored = report_store.get(analysis_id)
+    if stored is None:
+        raise HTTPException(status_code=404, detail=f"No stored report '{analysis_id}'")
+    return _serve_stored(stored, request)
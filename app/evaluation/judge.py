@@ -0,0 +1,112 @@
+import json
+import os
+import re
+from typing import Any
+
+from app.tools.llm import api_errors, call_llm
+from app.tools.llm import get_client as _get_client
+
+# Each criterion is scored from 1 (poor) to 5 (excellent)
+JUDGE_CRITERIA = ("actionability", "specificity", "coherence", "faithfulness")
+
+
+def _judge_model() -> str:
+    return os.environ.get("JUDGE_MODEL", os.environ.get("ANTHROPIC_MODEL", "claude-haiku-4-5-20251001"))
+
+
+def build_judge_params(product_name: str, market: str, report: dict[str, Any]) -> dict[str, Any]:
+    """Build the messages.create parameters used to score one report."""
+    system_prompt = (
+        "You are a strict reviewer of market intelligence reports. "
+        "Score the report only on what it contains; do not reward length."
+    )
+
+    user_prompt = f"""Evaluate this market intelligence report for {product_name} in the {market} market.
+
+Report:
+{json.dumps(report)}
+
+Score each criterion from 1 (poor) to 5 (excellent):
+- actionability: recommendations are concrete and can be acted on
+- specificity: the analysis is specific to this product and this market
+- coherence: the executive summary agrees with the detailed sections
+- faithfulness: claims are supported by the numbers in the report
+
+Respond with ONLY valid JSON in this exact format, no markdown, no explanation:
+{{
+    "actionability": <int 1-5>,
+    "specificity": <int 1-5>,
+    "coherence": <int 1-5>,
+    "faithfulness": <int 1-5>,
+    "rationale": "<one sentence>"
+}}"""
+
+    return {
+        "model": _judge_model(),
+        "max_tokens": 256,
+        "temperature": 0.0,
+        "system": system_prompt,
+        "messages": [{"role": "user", "content": user_prompt}],
+    }
+
+
+def parse_judge_response(raw: str) -> dict[str, Any]:
+    """Extract criterion scores from the judge output and add their mean as `overall`."""
+    match = re.search(r'\{.*\}', raw, re.DOTALL)
+    if not match:
+        raise ValueError(f"No JSON object found in judge response: {raw!r}")
+    data = json.loads(match.group())
+    scores: dict[str, Any] = {criterion: float(data[criterion]) for criterion in JUDGE_CRITERIA}
+    scores["overall"] = round(sum(scores.values()) / len(JUDGE_CRITERIA), 2)
+    scores["rationale"] = data.get("rationale", "")
+    return scores
+
+
+def judge_report(product_name: str, market: str, report: dict[str, Any]) -> dict[str, Any]:
+    """Score one report synchronously. Used by the gold-set replay, not on the request path."""
+    message = call_llm(_get_client(), "report evaluation", **build_judge_params(product_name, market, report))
+    return parse_judge_response(message.content[0].text)
+
+
+def submit_judge_batch(items: dict[str, dict[str, Any]]) -> str:
+    """
+    Submit several reports for scoring through the Message Batches API.
+
+    `items` maps an analysis id to {"product_name", "market", "report"}.
+    Batches are billed at a discount and processed at lower priority, which
+    suits evaluation: nobody is waiting on the result. Returns the batch id
+    right away; `collect_judge_batch` fetches the scores once it has ended.
+    """
+    client = _get_client()
+    with api_errors("batch evaluation"):
+        batch = client.messages.batches.create(
+            requests=[
+                {
+                    "custom_id": analysis_id,
+                    "params": build_judge_params(item["product_name"], item["market"], item["report"]),
+                }
+                for analysis_id, item in items.items()
+            ]
+        )
+    return batch.id
+
+
+def collect_judge_batch(batch_id: str) -> dict[str, dict[str, Any]] | None:
+    """Scores by analysis id once the batch has ended, None while it is still processing."""
+    client = _get_client()
+    with api_errors("batch evaluation"):
+        batch = client.messages.batches.retrieve(batch_id)
+        if batch.processing_status != "ended":
+            return None
+        entries = list(client.messages.batches.results(batch_id))
+
+    # Individual failures are left out of the returned mapping
+    scores: dict[str, dict[str, Any]] = {}
+    for entry in entries:
+        if entry.result.type != "succeeded":
+            continue
+        try:
+            scores[entry.custom_id] = parse_judge_response(entry.result.message.content[0].text)
+        except (ValueError, KeyError):
+            continue
+    return scores
@@ -0,0 +1,150 @@
+import json
+import logging
+import os
+import random
+import threading
+import time
+from typing import Any
+
+from app.evaluation.judge import collect_judge_batch, submit_judge_batch
+from app.evaluation.store import score_store
+from app.orchestrator.agent import REPORT_SECTIONS
+
+logger = logging.getLogger(__name__)
+
+
+class EvaluationQueue:
+    """
+    Samples completed analyses and scores them off the request path.
+
+    `maybe_enqueue` is meant to run as a FastAPI background task, i.e. after
+    the response has been sent. At most JUDGE_MAX_PENDING analyses wait in
+    the queue; beyond that, sampled analyses are dropped. A daemon worker
+    thread submits the queue in batches of JUDGE_BATCH_SIZE, or every
+    JUDGE_FLUSH_SECONDS, through the Message Batches API, and checks
+    submitted batches every JUDGE_POLL_SECONDS instead of blocking on them.
+    Settings are read from the environment at call time so values from
+    `.env` are picked up.
+    """
+
+    def __init__(self) -> None:
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._in_flight: dict[str, dict[str, dict[str, Any]]] = {}  # batch id -> submitted items
+        self._condition = threading.Condition()
+        self._worker: threading.Thread | None = None
+
+    @staticmethod
+    def sample_rate() -> float:
+        return float(os.environ.get("JUDGE_SAMPLE_RATE", "0.0"))
+
+    @staticmethod
+    def batch_size() -> int:
+        return int(os.environ.get("JUDGE_BATCH_SIZE", "20"))
+
+    @staticmethod
+    def flush_seconds() -> float:
+        return float(os.environ.get("JUDGE_FLUSH_SECONDS", "60"))
+
+    @staticmethod
+    def poll_seconds() -> float:
+        return float(os.environ.get("JUDGE_POLL_SECONDS", "30"))
+
+    @staticmethod
+    def max_pending() -> int:
+        return int(os.environ.get("JUDGE_MAX_PENDING", "500"))
+
+    def maybe_enqueue(self, product_name: str, market: str, analysis_json: bytes) -> bool:
+        """
+        Queue a fresh, complete analysis for scoring with probability JUDGE_SAMPLE_RATE.
+
+        Takes the serialized response, which is only parsed once sampled.
+        """
+        if random.random() >= self.sample_rate():
+            return False
+        analysis = json.loads(analysis_json)
+        if analysis.get("analysis_id") is None or analysis.get("delivery") != "complete":
+            return False
+
+        with self._condition:
+            if len(self._pending) >= self.max_pending():
+                logger.warning(
+                    "Evaluation queue full (%d pending), dropping analysis %s",
+                    len(self._pending), analysis["analysis_id"],
+                )
+                return False
+            self._pending[analysis["analysis_id"]] = {
+                "product_name": product_name,
+                "market": market,
+                "prompt_version": analysis.get("prompt_version") or "unknown",
+                "model": analysis.get("model") or "unknown",
+                "profile": analysis.get("profile") or "full",
+                "report": {
+                    section: analysis[section] for section in REPORT_SECTIONS if analysis.get(section) is not None
+                },
+            }
+            if len(self._pending) >= self.batch_size():
+                self._condition.notify()
+        self._ensure_worker()
+        return True
+
+    def flush(self) -> int:
+        """Submit everything currently queued as one batch. Returns the number of reports submitted."""
+        with self._condition:
+            items, self._pending = self._pending, {}
+        if not items:
+            return 0
+
+        try:
+            batch_id = submit_judge_batch(items)
+        except Exception as exc:
+            logger.error("Evaluation batch of %d failed: %s", len(items), exc)
+            return 0
+
+        with self._condition:
+            self._in_flight[batch_id] = items
+        return len(items)
+
+    def poll(self) -> int:
+        """Store the scores of submitted batches that have ended. Returns the number of reports scored."""
+        with self._condition:
+            in_flight = dict(self._in_flight)
+
+        scored = 0
+        for batch_id, items in in_flight.items():
+            try:
+                scores = collect_judge_batch(batch_id)
+            except Exception as exc:
+                logger.error("Polling evaluation batch %s failed: %s", batch_id, exc)
+                continue
+            if scores is None:
+                continue
+
+            with self._condition:
+                self._in_flight.pop(batch_id, None)
+            for analysis_id, result in scores.items():
+                item = items[analysis_id]
+                score_store.add(analysis_id, item["prompt_version"], item["model"], item["profile"], result)
+            logger.info("Scored %d/%d sampled analyses", len(scores), len(items))
+            scored += len(scores)
+        return scored
+
+    def _ensure_worker(self) -> None:
+        with self._condition:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="evaluation-worker", daemon=True)
+                self._worker.start()
+
+    def _run(self) -> None:
+        last_flush = time.monotonic()
+        while True:
+            with self._condition:
+                timeout = self.poll_seconds() if self._in_flight else self.flush_seconds()
+                self._condition.wait_for(lambda: len(self._pending) >= self.batch_size(), timeout=timeout)
+                full = len(self._pending) >= self.batch_size()
+            if full or time.monotonic() - last_flush >= self.flush_seconds():
+                self.flush()
+                last_flush = time.monotonic()
+            self.poll()
+
+
+evaluation_queue = EvaluationQueue()
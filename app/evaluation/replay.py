@@ -0,0 +1,79 @@
+"""
+Gold-set replay: score the current report prompt offline before deploying it.
+
+Regenerates a report for every gold-set case with the current prompt and
+scores it with the judge, both against a local LLM stand-in exposing the
+Anthropic Messages API (for example Ollama or a LiteLLM proxy). Exits with
+status 1 when the mean score falls below the gold-set reference by more than
+the tolerance.
+
+    python -m app.evaluation.replay --base-url http://localhost:11434 --model llama3.1
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any
+
+from dotenv import load_dotenv
+
+DEFAULT_GOLD_SET = Path(__file__).resolve().parents[2] / "examples" / "gold_set.json"
+
+
+def replay(gold_set: dict[str, Any]) -> list[dict[str, Any]]:
+    # Imported here so the client settings from main() are in place first
+    from app.evaluation.judge import judge_report
+    from app.models.profile import REPORT_PROFILES
+    from app.tools.report import run_report_generator
+
+    results = []
+    for case in gold_set["cases"]:
+        report = run_report_generator(
+            case["product_name"],
+            case["market"],
+            case["scraper_data"],
+            case["sentiment_data"],
+            profile=REPORT_PROFILES[case.get("profile", "full")],
+        )
+        scores = judge_report(case["product_name"], case["market"], report)
+        results.append({"id": case["id"], "reference": case["reference_score"], "scores": scores})
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Score the current report prompt against the gold set.")
+    parser.add_argument("--gold-set", type=Path, default=DEFAULT_GOLD_SET)
+    parser.add_argument("--base-url", default=os.environ.get("LOCAL_LLM_BASE_URL", "http://localhost:11434"))
+    parser.add_argument("--model", default=os.environ.get("LOCAL_LLM_MODEL"))
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    load_dotenv()
+    # The tools build their clients lazily from the environment, so pointing
+    # the SDK at the stand-in here routes every call there.
+    os.environ["ANTHROPIC_BASE_URL"] = args.base_url
+    os.environ.setdefault("ANTHROPIC_API_KEY", "local")
+    if args.model:
+        os.environ["ANTHROPIC_MODEL"] = args.model
+        os.environ["JUDGE_MODEL"] = args.model
+
+    from app.tools.report import PROMPT_VERSION
+
+    results = replay(json.loads(args.gold_set.read_text()))
+
+    print(f"Prompt version {PROMPT_VERSION} on {len(results)} gold-set cases")
+    for result in results:
+        print(f"  {result['id']:<30} overall {result['scores']['overall']:.2f}  (reference {result['reference']:.2f})")
+
+    mean = sum(r["scores"]["overall"] for r in results) / len(results)
+    reference = sum(r["reference"] for r in results) / len(results)
+    print(f"Mean {mean:.2f} vs reference {reference:.2f} (tolerance {args.tolerance:.2f})")
+    if mean < reference - args.tolerance:
+        print("REGRESSION: the prompt change scores below the gold set")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,74 @@
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any
+
+from app.evaluation.judge import JUDGE_CRITERIA
+
+
+class ScoreStore:
+    """
+    In-process store of judge scores, keyed by analysis id.
+
+    Mirrors the scores table described in the README (étape 7) until a
+    database is wired in. Rolling averages are computed over the last
+    `window` scores for each (prompt_version, model, profile): profiles
+    build different prompts under the same prompt version. Only the most
+    recent `max_analyses` per-analysis records are kept.
+    """
+
+    def __init__(self, window: int = 100, max_analyses: int = 1000) -> None:
+        self._window = window
+        self._max_analyses = max_analyses
+        self._by_analysis: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._recent: dict[tuple[str, str, str], deque[dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, analysis_id: str, prompt_version: str, model: str, profile: str, scores: dict[str, Any]) -> None:
+        record = {
+            "analysis_id": analysis_id,
+            "prompt_version": prompt_version,
+            "model": model,
+            "profile": profile,
+            "scores": scores,
+            "scored_at": time.time(),
+        }
+        with self._lock:
+            self._by_analysis[analysis_id] = record
+            while len(self._by_analysis) > self._max_analyses:
+                self._by_analysis.popitem(last=False)
+            key = (prompt_version, model, profile)
+            if key not in self._recent:
+                self._recent[key] = deque(maxlen=self._window)
+            self._recent[key].append(record)
+
+    def get(self, analysis_id: str) -> dict[str, Any] | None:
+        with self._lock:
+            return self._by_analysis.get(analysis_id)
+
+    def averages(self) -> list[dict[str, Any]]:
+        with self._lock:
+            groups = {key: list(records) for key, records in self._recent.items()}
+
+        summary = []
+        for (prompt_version, model, profile), records in sorted(groups.items()):
+            averages = {
+                name: round(sum(r["scores"][name] for r in records) / len(records), 2)
+                for name in (*JUDGE_CRITERIA, "overall")
+            }
+            summary.append({
+                "prompt_version": prompt_version,
+                "model": model,
+                "profile": profile,
+                "count": len(records),
+                "averages": averages,
+            })
+        return summary
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_analysis.clear()
+            self._recent.clear()
+
+
+score_store = ScoreStore()
@@ -1,9 +1,14 @@
 import logging
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 
 from app.api.routes import router
+from app.startup import readiness, warm_up
 
 load_dotenv()
 
@@ -12,6 +17,18 @@ logging.basicConfig(
     format="%(asctime)s | %(levelname)s | %(name)s | %(message)s",
 )
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Warm up in the background so the worker accepts connections (and
+    # answers /health) right away; /ready flips once warm-up is done.
+    if os.environ.get("WARMUP_ON_STARTUP", "1") == "1":
+        threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
+    else:
+        readiness.mark_ready({"warm_up": "skipped"})
+    yield
+
+
 app = FastAPI(
     title="MoovAI Market Analysis Agent",
     description=(
@@ -19,6 +36,7 @@ app = FastAPI(
         "generation to produce structured market intelligence for the Canadian market."
     ),
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.include_router(router)
@@ -27,3 +45,11 @@ app.include_router(router)
 @app.get("/health")
 def health_check() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@app.get("/ready")
+def readiness_check(response: Response) -> dict[str, Any]:
+    """503 until warm-up has loaded deferred modules and opened the LLM connection."""
+    if not readiness.is_ready:
+        response.status_code = 503
+    return readiness.status()
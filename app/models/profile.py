@@ -0,0 +1,72 @@
+from typing import Any, Literal
+
+from pydantic import BaseModel
+
+Focus = Literal["pricing", "competitors", "specifications", "sentiment"]
+
+# Report section produced for each focus area. executive_summary and
+# strategic_recommendations are always generated.
+FOCUS_SECTIONS: dict[str, str] = {
+    "pricing": "pricing_analysis",
+    "competitors": "competitive_landscape",
+    "sentiment": "sentiment_analysis",
+}
+
+# Output budget for the report LLM call, by format
+FORMAT_MAX_TOKENS: dict[str, int] = {
+    "detailed": 2048,
+    "summary": 1024,
+    "bullets": 768,
+}
+
+# How much narrative each format asks for, so the output shrinks with the budget
+FORMAT_LENGTHS: dict[str, dict[str, Any]] = {
+    "detailed": {"sentences": "2-3", "advantages": 3, "recommendations": 4},
+    "summary": {"sentences": "1-2", "advantages": 2, "recommendations": 3},
+    "bullets": {"sentences": "1", "advantages": 2, "recommendations": 3},
+}
+
+
+class ReportProfile(BaseModel):
+    """
+    Named report configuration, mirroring the `report_configs` table in the README.
+
+    `focus` decides which data reaches the prompt, which sections are generated,
+    and whether the sentiment stage runs at all. `format` scales max_tokens
+    together with the length of the narrative requested.
+    """
+
+    name: str
+    focus: list[Focus]
+    format: Literal["detailed", "summary", "bullets"] = "detailed"
+    language: Literal["en", "fr"] = "en"
+    custom_instructions: str = ""
+
+    @property
+    def sections(self) -> list[str]:
+        return [FOCUS_SECTIONS[f] for f in self.focus if f in FOCUS_SECTIONS]
+
+    @property
+    def max_tokens(self) -> int:
+        return FORMAT_MAX_TOKENS[self.format]
+
+    @property
+    def lengths(self) -> dict[str, Any]:
+        return FORMAT_LENGTHS[self.format]
+
+    @property
+    def needs_sentiment(self) -> bool:
+        return "sentiment" in self.focus
+
+
+REPORT_PROFILES: dict[str, ReportProfile] = {
+    profile.name: profile
+    for profile in (
+        ReportProfile(name="full", focus=["pricing", "competitors", "specifications", "sentiment"]),
+        ReportProfile(name="executive", focus=["pricing", "competitors", "sentiment"], format="summary"),
+        ReportProfile(name="pricing", focus=["pricing", "competitors"], format="summary"),
+        ReportProfile(name="sentiment", focus=["sentiment"], format="summary"),
+    )
+}
+
+DEFAULT_PROFILE = REPORT_PROFILES["full"]
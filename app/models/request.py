@@ -1,9 +1,24 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
+
+from app.models.profile import REPORT_PROFILES
 
 
 class AnalyzeRequest(BaseModel):
     product_name: str
     market: str
+    # Total time budget for the pipeline. When set, stages that cannot finish
+    # in time are served from cache or omitted instead of failing the request.
+    deadline_ms: int | None = Field(default=None, gt=0)
+    # Named report profile (see app/models/profile.py): "full", "executive",
+    # "pricing" or "sentiment"
+    profile: str = "full"
+
+    @field_validator("profile")
+    @classmethod
+    def profile_must_exist(cls, value: str) -> str:
+        if value not in REPORT_PROFILES:
+            raise ValueError(f"Unknown report profile '{value}'. Available: {', '.join(REPORT_PROFILES)}")
+        return value
 
     model_config = {
         "json_schema_extra": {
@@ -1,4 +1,4 @@
-from typing import Any
+from typing import Any, Literal
 
 from pydantic import BaseModel
 
@@ -33,9 +33,33 @@ class SentimentAnalysis(BaseModel):
     value_positioning: str
 
 
+class StageStatus(BaseModel):
+    source: Literal["fresh", "cache", "unavailable", "skipped"]
+    age_seconds: float | None = None
+
+
 class AnalyzeResponse(BaseModel):
-    executive_summary: str
-    pricing_analysis: PricingAnalysis
-    competitive_landscape: CompetitiveLandscape
-    sentiment_analysis: SentimentAnalysis
-    strategic_recommendations: list[str]
+    # A section is None either because the report profile does not cover it
+    # (listed in `omitted_sections`) or because a deadline left it unavailable
+    # (listed in `unavailable_sections`).
+    executive_summary: str | None = None
+    pricing_analysis: PricingAnalysis | None = None
+    competitive_landscape: CompetitiveLandscape | None = None
+    sentiment_analysis: SentimentAnalysis | None = None
+    strategic_recommendations: list[str] | None = None
+    delivery: Literal["complete", "stale", "partial"] = "complete"
+    stages: dict[str, StageStatus] = {}
+    unavailable_sections: list[str] = []
+    profile: str = "full"
+    omitted_sections: list[str] = []
+    analysis_id: str | None = None
+    prompt_version: str | None = None
+    model: str | None = None
+
+
+class QualitySummary(BaseModel):
+    prompt_version: str
+    model: str
+    profile: str
+    count: int
+    averages: dict[str, float]
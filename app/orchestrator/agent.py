@@ -1,14 +1,97 @@
 import logging
-from typing import Any
+import os
+import time
+import uuid
+from typing import Any, Callable
 
-from app.tools.report import run_report_generator
+from app.models.profile import DEFAULT_PROFILE, ReportProfile
+from app.orchestrator.cache import CachedStage, stage_cache
+from app.profiling.trace import span
+from app.tools.report import PROMPT_VERSION, run_report_generator
 from app.tools.scraper import run_scraper
 from app.tools.sentiment import run_sentiment_analysis
 
 logger = logging.getLogger(__name__)
 
+REPORT_SECTIONS = (
+    "executive_summary",
+    "pricing_analysis",
+    "competitive_landscape",
+    "sentiment_analysis",
+    "strategic_recommendations",
+)
 
-def orchestrate(product_name: str, market: str) -> dict[str, Any]:
+
+class Deadline:
+    """Monotonic time budget for one pipeline run. `None` means unbounded."""
+
+    def __init__(self, deadline_ms: int | None) -> None:
+        self._expires_at = None if deadline_ms is None else time.monotonic() + deadline_ms / 1000
+
+    def remaining(self) -> float | None:
+        if self._expires_at is None:
+            return None
+        return self._expires_at - time.monotonic()
+
+
+def _run_stage(
+    stage: str,
+    tool: Callable[..., dict[str, Any]],
+    product_name: str,
+    market: str,
+    deadline: Deadline,
+    stages: dict[str, dict[str, Any]],
+    variant: str = "",
+) -> dict[str, Any] | None:
+    """
+    Run one tool within the remaining budget.
+
+    Without a deadline this is a plain call and every exception propagates.
+    With a deadline, a stage that cannot finish in time (budget already spent,
+    or the tool raised TimeoutError) falls back to the latest cached result
+    for that stage, or to None when nothing is cached. The tool is always
+    tried while budget remains, so a stage that was once slow gets a fresh
+    result again as soon as it is fast enough. The outcome is recorded in
+    `stages`.
+    """
+    remaining = deadline.remaining()
+    cached = stage_cache.get(stage, product_name, market, variant)
+
+    if remaining is not None and remaining <= 0:
+        logger.warning("Skipping %s: %.0fms left in budget", stage, max(remaining, 0) * 1000)
+        return _fallback(stage, cached, stages)
+
+    start = time.monotonic()
+    try:
+        with span(stage):
+            result = tool(timeout=remaining)
+    except TimeoutError:
+        if remaining is None:
+            raise
+        logger.warning("%s timed out after %.0fms", stage, (time.monotonic() - start) * 1000)
+        return _fallback(stage, cached, stages)
+
+    stage_cache.put(stage, product_name, market, result, variant)
+    stages[stage] = {"source": "fresh"}
+    return result
+
+
+def _fallback(stage: str, cached: CachedStage | None, stages: dict[str, dict[str, Any]]) -> dict[str, Any] | None:
+    if cached is None:
+        logger.warning("No cached %s result, marking as unavailable", stage)
+        stages[stage] = {"source": "unavailable"}
+        return None
+    logger.warning("Serving cached %s result (%.1fs old)", stage, cached.age_seconds)
+    stages[stage] = {"source": "cache", "age_seconds": cached.age_seconds}
+    return cached.value
+
+
+def orchestrate(
+    product_name: str,
+    market: str,
+    deadline_ms: int | None = None,
+    profile: ReportProfile = DEFAULT_PROFILE,
+) -> dict[str, Any]:
     """
     Core orchestrator that coordinates tool execution in sequence.
 
@@ -17,33 +100,102 @@ def orchestrate(product_name: str, market: str) -> dict[str, Any]:
     2. Sentiment Tool   → structured review insights
     3. Report Generator → final strategic report
 
-    Each step is logged. Exceptions propagate to the API layer for
-    centralized HTTP error handling.
+    Each step is logged. Without `deadline_ms`, exceptions propagate to the
+    API layer for centralized HTTP error handling. With `deadline_ms`, the
+    remaining budget is passed to each tool, and stages that run out of time,
+    or whose inputs an earlier stage could not provide, are served from cache
+    (delivery "stale") or left out (delivery "partial").
+
+    `profile` scopes the run: the sentiment stage is skipped when the profile
+    does not focus on sentiment, and sections outside the profile are listed
+    in `omitted_sections` rather than generated.
     """
     logger.info("Starting analysis for '%s' in %s", product_name, market)
+    deadline = Deadline(deadline_ms)
+    stages: dict[str, dict[str, Any]] = {}
+    sentiment_data = None
 
     # Step 1: Collect market data
     logger.info("Step 1/3: Running web scraper")
-    scraper_data = run_scraper(product_name, market)
-    logger.info(
-        "Scraper complete. Retailers: %d | Competitors: %d | Reviews: %d",
-        len(scraper_data["prices_by_retailer"]),
-        len(scraper_data["competitors"]),
-        len(scraper_data["review_samples"]),
+    scraper_data = _run_stage(
+        "scraper", lambda timeout: run_scraper(product_name, market, timeout=timeout),
+        product_name, market, deadline, stages,
     )
+    if scraper_data is not None:
+        logger.info(
+            "Scraper complete. Retailers: %d | Competitors: %d | Reviews: %d",
+            len(scraper_data["prices_by_retailer"]),
+            len(scraper_data["competitors"]),
+            len(scraper_data["review_samples"]),
+        )
 
     # Step 2: Analyze sentiment from collected reviews
-    logger.info("Step 2/3: Running sentiment analysis")
-    sentiment_data = run_sentiment_analysis(product_name, market, scraper_data["review_samples"])
-    logger.info(
-        "Sentiment complete. Overall: %s (score: %.2f)",
-        sentiment_data["overall_sentiment"],
-        sentiment_data["sentiment_score"],
-    )
+    if not profile.needs_sentiment:
+        logger.info("Step 2/3: Skipped, profile '%s' does not use sentiment", profile.name)
+        stages["sentiment"] = {"source": "skipped"}
+    elif scraper_data is None:
+        # Inputs are missing, but an earlier run may have left a usable result
+        logger.warning("Step 2/3: No market data, looking for a cached sentiment analysis")
+        sentiment_data = _fallback("sentiment", stage_cache.get("sentiment", product_name, market), stages)
+    else:
+        logger.info("Step 2/3: Running sentiment analysis")
+        sentiment_data = _run_stage(
+            "sentiment",
+            lambda timeout: run_sentiment_analysis(
+                product_name, market, scraper_data["review_samples"], timeout=timeout
+            ),
+            product_name, market, deadline, stages,
+        )
+    if sentiment_data is not None:
+        logger.info(
+            "Sentiment complete. Overall: %s (score: %.2f)",
+            sentiment_data["overall_sentiment"],
+            sentiment_data["sentiment_score"],
+        )
 
     # Step 3: Generate strategic report from aggregated data
-    logger.info("Step 3/3: Generating strategic report")
-    report = run_report_generator(product_name, market, scraper_data, sentiment_data)
-    logger.info("Report generation complete")
+    if scraper_data is None or (profile.needs_sentiment and sentiment_data is None):
+        logger.warning("Step 3/3: Missing inputs, looking for a cached report (profile: %s)", profile.name)
+        report = _fallback("report", stage_cache.get("report", product_name, market, profile.name), stages)
+    else:
+        logger.info("Step 3/3: Generating strategic report (profile: %s)", profile.name)
+        report = _run_stage(
+            "report",
+            lambda timeout: run_report_generator(
+                product_name, market, scraper_data, sentiment_data, timeout=timeout, profile=profile
+            ),
+            product_name, market, deadline, stages, variant=profile.name,
+        )
+
+    expected = ["executive_summary", *profile.sections, "strategic_recommendations"]
+    omitted = [section for section in REPORT_SECTIONS if section not in expected]
+    if report is not None:
+        if stages["report"]["source"] == "fresh":
+            logger.info("Report generation complete")
+        result = {section: report.get(section) for section in expected}
+    else:
+        # Salvage what the earlier stages produced; the sentiment tool output
+        # already matches the response schema for that section.
+        result = {section: None for section in expected}
+        if profile.needs_sentiment:
+            result["sentiment_analysis"] = sentiment_data
+
+    unavailable = [section for section in expected if result.get(section) is None]
+    if unavailable:
+        delivery = "partial"
+    elif any(status["source"] == "cache" for status in stages.values()):
+        delivery = "stale"
+    else:
+        delivery = "complete"
+    if delivery != "complete":
+        logger.warning("Returning %s analysis. Unavailable sections: %s", delivery, unavailable)
 
-    return report
+    result["delivery"] = delivery
+    result["stages"] = stages
+    result["unavailable_sections"] = unavailable
+    result["profile"] = profile.name
+    result["omitted_sections"] = omitted
+    result["analysis_id"] = uuid.uuid4().hex
+    result["prompt_version"] = PROMPT_VERSION
+    result["model"] = os.environ.get("ANTHROPIC_MODEL", "claude-haiku-4-5-20251001")
+    return result
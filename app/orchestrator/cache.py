@@ -0,0 +1,62 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass
+class CachedStage:
+    value: Any
+    stored_at: float     # time.time() when the result was produced
+
+    @property
+    def age_seconds(self) -> float:
+        return round(time.time() - self.stored_at, 1)
+
+
+class StageCache:
+    """
+    In-process cache of the latest successful result for each pipeline stage.
+
+    Keys follow the Redis layout described in the README
+    (`{stage}:{product_name}:{market}`) so this can be swapped for a shared
+    cache without touching the orchestrator. There is no TTL: entries are only
+    served when a deadline forces the pipeline to choose between a stale
+    answer and no answer. `variant` separates results that depend on more
+    than product and market, such as reports built for different profiles.
+    Only the `max_entries` most recently used entries are kept.
+    """
+
+    def __init__(self, max_entries: int = 1000) -> None:
+        self._max_entries = max_entries
+        self._entries: OrderedDict[str, CachedStage] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(stage: str, product_name: str, market: str, variant: str) -> str:
+        key = f"{stage}:{product_name.strip().lower()}:{market.strip().lower()}"
+        return f"{key}:{variant}" if variant else key
+
+    def get(self, stage: str, product_name: str, market: str, variant: str = "") -> CachedStage | None:
+        key = self._key(stage, product_name, market, variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def put(self, stage: str, product_name: str, market: str, value: Any, variant: str = "") -> None:
+        key = self._key(stage, product_name, market, variant)
+        with self._lock:
+            self._entries[key] = CachedStage(value=value, stored_at=time.time())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+stage_cache = StageCache()
@@ -0,0 +1,46 @@
+import json
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from app.profiling.trace import Trace
+
+logger = logging.getLogger(__name__)
+
+
+class TraceStore:
+    """
+    Keeps the most recent profiled traces in memory for the side endpoint.
+
+    When PROFILE_DUMP_DIR is set, each trace is also written there as a
+    Chrome-trace JSON file named after the trace id.
+    """
+
+    def __init__(self, max_traces: int = 100) -> None:
+        self._max_traces = max_traces
+        self._traces: OrderedDict[str, Trace] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, trace: Trace) -> None:
+        with self._lock:
+            self._traces[trace.id] = trace
+            while len(self._traces) > self._max_traces:
+                self._traces.popitem(last=False)
+
+        dump_dir = os.environ.get("PROFILE_DUMP_DIR")
+        if dump_dir:
+            path = Path(dump_dir) / f"{trace.id}.json"
+            try:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                path.write_text(json.dumps(trace.chrome_trace()))
+            except OSError as exc:
+                logger.warning("Could not write Chrome trace to %s: %s", path, exc)
+
+    def get(self, trace_id: str) -> Trace | None:
+        with self._lock:
+            return self._traces.get(trace_id)
+
+
+trace_store = TraceStore()
@@ -0,0 +1,174 @@
+import cProfile
+import io
+import pstats
+import threading
+import time
+import uuid
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Iterator
+
+_current: ContextVar["Trace | None"] = ContextVar("profiling_trace", default=None)
+_NOOP = nullcontext()
+
+# cProfile hooks the interpreter, not the calling thread: since Python 3.12 a
+# profiler sees every thread, and enabling a second one raises ValueError.
+_cprofile_lock = threading.Lock()
+
+
+@dataclass
+class Span:
+    name: str
+    start: float        # time.perf_counter() seconds
+    end: float
+    depth: int
+
+    @property
+    def duration_ms(self) -> float:
+        return round((self.end - self.start) * 1000, 3)
+
+
+@dataclass
+class Trace:
+    """Spans recorded for one profiled request, timed with the monotonic perf_counter."""
+
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    origin: float = field(default_factory=time.perf_counter)
+    spans: list[Span] = field(default_factory=list)
+    measure_ttft: bool = False
+    cprofile_status: str | None = None      # "captured", "busy" or "unavailable" when requested
+    cprofile_stats: str | None = None
+    _depth: int = 0
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        self._depth += 1
+        depth = self._depth
+        try:
+            yield
+        finally:
+            self._depth -= 1
+            self.spans.append(Span(name, start, time.perf_counter(), depth))
+
+    def add(self, name: str, start: float, end: float) -> None:
+        """Record a span measured outside a `with` block, such as time-to-first-token."""
+        self.spans.append(Span(name, start, end, self._depth + 1))
+
+    def summary(self) -> dict[str, Any]:
+        spans = sorted(self.spans, key=lambda s: s.start)
+        return {
+            "id": self.id,
+            "spans": [
+                {
+                    "name": s.name,
+                    "depth": s.depth,
+                    "start_ms": round((s.start - self.origin) * 1000, 3),
+                    "duration_ms": s.duration_ms,
+                }
+                for s in spans
+            ],
+            "cprofile_status": self.cprofile_status,
+            "cprofile": self.cprofile_stats,
+        }
+
+    def server_timing(self) -> str:
+        """Top-level spans as a Server-Timing header value."""
+        return ", ".join(
+            f"{s.name.replace(' ', '_')};dur={s.duration_ms}"
+            for s in sorted(self.spans, key=lambda s: s.start) if s.depth == 1
+        )
+
+    def chrome_trace(self) -> dict[str, Any]:
+        """Spans in the Chrome trace event format (chrome://tracing, Perfetto)."""
+        return {
+            "traceEvents": [
+                {
+                    "name": s.name,
+                    "ph": "X",
+                    "ts": round((s.start - self.origin) * 1e6, 1),
+                    "dur": round((s.end - s.start) * 1e6, 1),
+                    "pid": 1,
+                    "tid": 1,
+                }
+                for s in self.spans
+            ],
+            "displayTimeUnit": "ms",
+        }
+
+
+def span(name: str):
+    """Time a block when the current request is profiled; a shared no-op otherwise."""
+    trace = _current.get()
+    return _NOOP if trace is None else trace.span(name)
+
+
+@contextmanager
+def profiled(with_cprofile: bool = False, measure_ttft: bool = False) -> Iterator[Trace]:
+    """
+    Activate a trace for the enclosed block, optionally under cProfile.
+
+    cProfile stats cover the whole process while the block runs, including
+    other requests served concurrently. Only one request is profiled at a
+    time: if another holds the profiler, or a different profiling tool is
+    active, the block runs without it and `cprofile_status` says why.
+    """
+    trace = Trace(measure_ttft=measure_ttft)
+    token = _current.set(trace)
+    profiler = _start_cprofile(trace) if with_cprofile else None
+    try:
+        yield trace
+    finally:
+        if profiler is not None:
+            profiler.disable()
+            _cprofile_lock.release()
+            out = io.StringIO()
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(30)
+            trace.cprofile_stats = out.getvalue()
+        _current.reset(token)
+
+
+def _start_cprofile(trace: Trace) -> cProfile.Profile | None:
+    if not _cprofile_lock.acquire(blocking=False):
+        trace.cprofile_status = "busy"
+        return None
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:  # another profiling tool (debugger, coverage) is active
+        _cprofile_lock.release()
+        trace.cprofile_status = "unavailable"
+        return None
+    trace.cprofile_status = "captured"
+    return profiler
+
+
+def create_message(client: Any, **params: Any) -> Any:
+    """
+    `client.messages.create(**params)`, timed when the request is profiled.
+
+    The call is the same one unprofiled requests make, recorded as a
+    "network" span. Only when the trace measures time-to-first-token does it
+    go through the streaming API instead; the final message is the same, but
+    the code path differs and a `timeout` then bounds each read rather than
+    the whole call, so a deadline is not enforced in that mode.
+    """
+    trace = _current.get()
+    if trace is None:
+        return client.messages.create(**params)
+    if not trace.measure_ttft:
+        with trace.span("network"):
+            return client.messages.create(**params)
+
+    with trace.span("network"):
+        start = time.perf_counter()
+        with client.messages.stream(**params) as stream:
+            first_token = None
+            for _ in stream.text_stream:
+                if first_token is None:
+                    first_token = time.perf_counter()
+            message = stream.get_final_message()
+        if first_token is not None:
+            trace.add("time_to_first_token", start, first_token)
+    return message
@@ -0,0 +1,93 @@
+import gzip
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+# Bodies smaller than this are served uncompressed (same default as Starlette's GZipMiddleware)
+GZIP_MIN_SIZE = 500
+
+
+@dataclass(frozen=True)
+class StoredReport:
+    """
+    An analysis serialized once, when it is stored.
+
+    `body` is the JSON of an AnalyzeResponse that was already validated, so
+    it can be served as-is. The ETag is a content hash; the gzip variant has
+    its own strong ETag because it is a different representation.
+    """
+
+    analysis_id: str
+    product_name: str
+    market: str
+    profile: str
+    body: bytes
+    gzip_body: bytes | None
+    etag: str
+    gzip_etag: str
+    stored_at: float
+
+    @classmethod
+    def build(cls, analysis_id: str, product_name: str, market: str, profile: str, body: bytes) -> "StoredReport":
+        digest = hashlib.sha256(body).hexdigest()[:32]
+        return cls(
+            analysis_id=analysis_id,
+            product_name=product_name,
+            market=market,
+            profile=profile,
+            body=body,
+            gzip_body=gzip.compress(body, compresslevel=6, mtime=0) if len(body) >= GZIP_MIN_SIZE else None,
+            etag=f'"{digest}"',
+            gzip_etag=f'"{digest}-gzip"',
+            stored_at=time.time(),
+        )
+
+
+class ReportStore:
+    """
+    In-memory store of serialized analyses, by id and latest per product/market/profile.
+
+    Stands in for the `analyses` table described in the README (étape 4).
+    Only the most recent `max_reports` analyses are kept.
+    """
+
+    def __init__(self, max_reports: int = 1000) -> None:
+        self._max_reports = max_reports
+        self._by_id: OrderedDict[str, StoredReport] = OrderedDict()
+        self._latest: dict[tuple[str, str, str], str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(product_name: str, market: str, profile: str) -> tuple[str, str, str]:
+        return product_name.strip().lower(), market.strip().lower(), profile
+
+    def add(self, report: StoredReport, latest: bool = True) -> None:
+        """Store a report; with `latest`, it also becomes the one served for its product and market."""
+        with self._lock:
+            self._by_id[report.analysis_id] = report
+            if latest:
+                self._latest[self._key(report.product_name, report.market, report.profile)] = report.analysis_id
+            while len(self._by_id) > self._max_reports:
+                evicted_id, evicted = self._by_id.popitem(last=False)
+                key = self._key(evicted.product_name, evicted.market, evicted.profile)
+                if self._latest.get(key) == evicted_id:
+                    del self._latest[key]
+
+    def get(self, analysis_id: str) -> StoredReport | None:
+        with self._lock:
+            return self._by_id.get(analysis_id)
+
+    def latest(self, product_name: str, market: str, profile: str = "full") -> StoredReport | None:
+        with self._lock:
+            analysis_id = self._latest.get(self._key(product_name, market, profile))
+            return self._by_id.get(analysis_id) if analysis_id else None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._by_id.clear()
+            self._latest.clear()
+
+
+report_store = ReportStore()
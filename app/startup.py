@@ -0,0 +1,70 @@
+import logging
+import threading
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+class Readiness:
+    """Tracks whether the worker has finished warming up. /ready reports it."""
+
+    def __init__(self) -> None:
+        self._ready = threading.Event()
+        self._started_at = time.monotonic()
+        self._details: dict[str, Any] = {}
+
+    @property
+    def is_ready(self) -> bool:
+        return self._ready.is_set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        return self._ready.wait(timeout)
+
+    def mark_ready(self, details: dict[str, Any]) -> None:
+        self._details = details
+        self._ready.set()
+
+    def status(self) -> dict[str, Any]:
+        if not self.is_ready:
+            return {"status": "starting", "uptime_ms": round((time.monotonic() - self._started_at) * 1000)}
+        return {"status": "ready", **self._details}
+
+
+readiness = Readiness()
+
+
+def warm_up() -> None:
+    """
+    Load the modules deferred at import time and open the LLM connection.
+
+    Runs in a background thread from the app lifespan so /health answers
+    immediately; /ready turns 200 once this returns, whatever happened.
+    Failures are logged and reported in the details, never raised: a worker
+    that could not warm up or pre-connect still serves.
+    """
+    start = time.perf_counter()
+    details: dict[str, Any] = {"llm_connection": "failed"}
+    try:
+        step = time.perf_counter()
+        from app.tools.scraper import run_scraper
+
+        run_scraper("warm-up", "Canada", seed=0)  # loads NumPy and the synthetic engine
+        details["synthetic_engine_ms"] = round((time.perf_counter() - step) * 1000)
+
+        step = time.perf_counter()
+        from app.tools.llm import get_client, keepalive_seconds, open_connection
+
+        get_client()
+        details["llm_client_ms"] = round((time.perf_counter() - step) * 1000)
+        step = time.perf_counter()
+        details["llm_connection"] = "open" if open_connection() else "failed"
+        details["llm_connection_ms"] = round((time.perf_counter() - step) * 1000)
+        details["llm_keepalive_s"] = keepalive_seconds()
+    except Exception as exc:
+        logger.error("Warm-up failed: %s", exc, exc_info=True)
+        details["error"] = f"{type(exc).__name__}: {exc}"
+    finally:
+        details["warm_up_ms"] = round((time.perf_counter() - start) * 1000)
+        logger.info("Warm-up complete in %dms: %s", details["warm_up_ms"], details)
+        readiness.mark_ready(details)
@@ -0,0 +1,120 @@
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator
+
+from app.profiling.trace import create_message
+
+if TYPE_CHECKING:
+    import anthropic
+
+logger = logging.getLogger(__name__)
+
+_client: "anthropic.Anthropic | None" = None
+_lock = threading.Lock()
+
+
+def get_client() -> "anthropic.Anthropic":
+    """
+    Process-wide Anthropic client shared by every LLM tool.
+
+    Sharing one client means one HTTP connection pool, so a connection opened
+    by any call (or by `open_connection` at startup) is reused by the next.
+    The SDK is imported on first use: it is the heaviest import in the app
+    and is not needed to serve /health.
+    """
+    global _client
+    if _client is None:
+        with _lock:
+            if _client is None:
+                import anthropic
+
+                _client = anthropic.Anthropic(
+                    api_key=os.environ.get("ANTHROPIC_API_KEY"), http_client=_http_client()
+                )
+    return _client
+
+
+def keepalive_seconds() -> float:
+    """How long an idle pooled connection is kept (LLM_KEEPALIVE_SECONDS, default 300)."""
+    return float(os.environ.get("LLM_KEEPALIVE_SECONDS", "300"))
+
+
+def _http_client() -> Any:
+    """
+    The SDK's default HTTP client with a longer keep-alive.
+
+    The SDK drops idle connections after 5 seconds, so the connection opened
+    at warm-up would usually be gone by the first user request. The server
+    may still close it earlier; the pool then simply reconnects.
+    """
+    import anthropic
+
+    default = anthropic.DEFAULT_CONNECTION_LIMITS
+    # Built from the SDK's own Limits class so it matches the httpx it ships with
+    limits = type(default)(
+        max_connections=default.max_connections,
+        max_keepalive_connections=default.max_keepalive_connections,
+        keepalive_expiry=keepalive_seconds(),
+    )
+    return anthropic.DefaultHttpxClient(limits=limits)
+
+
+def open_connection(timeout: float = 5.0) -> bool:
+    """
+    Open a keep-alive TLS connection to the API ahead of the first user request.
+
+    Uses the models endpoint, which costs no tokens. Any HTTP response, even an
+    auth error, means the connection is established and pooled; only
+    connection failures return False.
+    """
+    import anthropic
+
+    try:
+        get_client().with_options(timeout=timeout, max_retries=0).models.list(limit=1)
+    except anthropic.APIStatusError as exc:
+        logger.warning("Warm-up request returned HTTP %s; connection is open", exc.status_code)
+    except anthropic.APIConnectionError as exc:
+        logger.warning("Could not open a warm connection to the Anthropic API: %s", exc)
+        return False
+    return True
+
+
+@contextmanager
+def api_errors(description: str, timeout: float | None = None) -> Iterator[None]:
+    """
+    Map SDK exceptions raised in the block to builtin ones.
+
+    APITimeoutError becomes TimeoutError (the orchestrator's deadline signal)
+    and any other APIError becomes RuntimeError, so callers never import the
+    SDK themselves.
+    """
+    import anthropic
+
+    try:
+        yield
+    except anthropic.APITimeoutError as e:
+        raise TimeoutError(f"LLM call for {description} did not finish within {timeout}s") from e
+    except anthropic.APIError as e:
+        raise RuntimeError(f"Anthropic API error during {description}: {e}") from e
+
+
+def call_llm(
+    client: "anthropic.Anthropic",
+    description: str,
+    timeout: float | None = None,
+    **params: Any,
+) -> "anthropic.types.Message":
+    """
+    Send one Messages API request and return the message.
+
+    `timeout` (seconds) bounds the whole call, not each attempt: the SDK
+    retries timeouts (twice by default, with backoff), which would overrun a
+    deadline several times over, so retries are disabled when it is set.
+    `description` names the call in the errors raised by `api_errors`.
+    """
+    if timeout is not None:
+        client = client.with_options(timeout=timeout, max_retries=0)
+    with api_errors(description, timeout):
+        return create_message(client, **params)
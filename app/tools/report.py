@@ -3,93 +3,159 @@ import os
 import re
 from typing import Any
 
-import anthropic
+from app.models.profile import DEFAULT_PROFILE, ReportProfile
+from app.profiling.trace import span
+from app.tools.llm import call_llm
+from app.tools.llm import get_client as _get_client
 
-_client: anthropic.Anthropic | None = None
+# Bump whenever the report prompt changes, so judge scores can be compared per version
+PROMPT_VERSION = "3"
 
 
-def _get_client() -> anthropic.Anthropic:
-    global _client
-    if _client is None:
-        _client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-    return _client
+_LANGUAGES = {"en": "English", "fr": "French"}
 
 
-def run_report_generator(
+def _build_prompts(
     product_name: str,
     market: str,
     scraper_data: dict[str, Any],
-    sentiment_data: dict[str, Any],
-) -> dict[str, Any]:
-    """
-    LLM-based report generator tool.
-
-    Acts as a Market Intelligence Analyst: synthesizes pricing data,
-    competitive landscape, and sentiment insights into a structured
-    strategic business report in JSON format.
-    """
+    sentiment_data: dict[str, Any] | None,
+    profile: ReportProfile,
+) -> tuple[str, str]:
+    """Build the system and user prompts, keeping only the data and sections the profile needs."""
     system_prompt = (
         f"You are a Market Intelligence Analyst specializing in the {market} market. "
         "Base your analysis strictly on the data provided. "
         "Do not invent prices, competitors, or market information not present in the input."
     )
-
-    user_prompt = f"""Generate a comprehensive market intelligence report based on the following data.
+    if profile.language != "en":
+        system_prompt += f" Write all narrative fields in {_LANGUAGES[profile.language]}."
+    if profile.custom_instructions:
+        system_prompt += f" {profile.custom_instructions}"
+
+    lengths = profile.lengths
+    sentences = lengths["sentences"]
+    data_blocks = []
+    # Only narrative is requested: data already known (retailers, prices,
+    # competitors, sentiment scores) is merged back in by `_merge_known_data`
+    # instead of being echoed by the model.
+    output_fields = [
+        f'"executive_summary": "<{sentences} sentence strategic summary of the product position in the {market} market>"'
+    ]
+    if "pricing" in profile.focus:
+        data_blocks.append(f"""Pricing Data:
+{json.dumps({"prices_by_retailer": scraper_data["prices_by_retailer"], "average_price": scraper_data["average_price"]}, indent=2)}""")
+        output_fields.append(f""""pricing_analysis": {{
+        "price_positioning": "<{sentences} sentences on how the product is priced relative to competitors in {market}>"
+    }}""")
+    if "competitors" in profile.focus:
+        data_blocks.append(f"""Competitor Landscape:
+{json.dumps(scraper_data["competitors"], indent=2)}""")
+        advantages = ", ".join(f'"advantage{i}"' for i in range(1, lengths["advantages"] + 1))
+        output_fields.append(f""""competitive_landscape": {{
+        "market_position": "<{sentences} sentences on where the product sits in the {market} competitive landscape>",
+        "competitive_advantages": [{advantages}]
+    }}""")
+    if "specifications" in profile.focus:
+        data_blocks.append(f"""Product Specifications:
+{json.dumps(scraper_data["specifications"], indent=2)}""")
+    if "sentiment" in profile.focus and sentiment_data is not None:
+        data_blocks.append(f"""Sentiment Analysis Results:
+{json.dumps(sentiment_data, indent=2)}""")
+    recommendations = ", ".join(f'"recommendation{i}"' for i in range(1, lengths["recommendations"] + 1))
+    output_fields.append(f'"strategic_recommendations": [{recommendations}]')
+
+    data_section = "\n\n".join(data_blocks)
+    output_section = ",\n    ".join(output_fields)
+    user_prompt = f"""Generate a {profile.format} market intelligence report based on the following data.
 
 Product: {product_name}
 Market: {market}
 
-Pricing Data:
-{json.dumps({"prices_by_retailer": scraper_data["prices_by_retailer"], "average_price": scraper_data["average_price"]}, indent=2)}
-
-Competitor Landscape:
-{json.dumps(scraper_data["competitors"], indent=2)}
-
-Product Specifications:
-{json.dumps(scraper_data["specifications"], indent=2)}
-
-Sentiment Analysis Results:
-{json.dumps(sentiment_data, indent=2)}
+{data_section}
 
 Respond with ONLY valid JSON in this exact format, no markdown, no explanation:
 {{
-    "executive_summary": "<2-3 sentence strategic summary of the product position in the {market} market>",
-    "pricing_analysis": {{
-        "retailers": {json.dumps(scraper_data["retailers"])},
-        "prices_by_retailer": {json.dumps(scraper_data["prices_by_retailer"])},
-        "average_price": {scraper_data["average_price"]},
-        "price_range": {{"min": <float>, "max": <float>}},
-        "price_positioning": "<narrative about how the product is priced relative to competitors in {market}>"
-    }},
-    "competitive_landscape": {{
-        "main_competitors": {json.dumps(scraper_data["competitors"])},
-        "market_position": "<description of where the product sits in the {market} competitive landscape>",
-        "competitive_advantages": ["advantage1", "advantage2", "advantage3"]
-    }},
-    "sentiment_analysis": {{
-        "overall_sentiment": "{sentiment_data['overall_sentiment']}",
-        "sentiment_score": {sentiment_data['sentiment_score']},
-        "strengths": {json.dumps(sentiment_data['strengths'])},
-        "weaknesses": {json.dumps(sentiment_data['weaknesses'])},
-        "value_positioning": "{sentiment_data['value_positioning']}"
-    }},
-    "strategic_recommendations": ["recommendation1", "recommendation2", "recommendation3", "recommendation4"]
+    {output_section}
 }}"""
+    return system_prompt, user_prompt
+
+
+def run_report_generator(
+    product_name: str,
+    market: str,
+    scraper_data: dict[str, Any],
+    sentiment_data: dict[str, Any] | None,
+    timeout: float | None = None,
+    profile: ReportProfile = DEFAULT_PROFILE,
+) -> dict[str, Any]:
+    """
+    LLM-based report generator tool.
 
-    client = _get_client()
-    try:
-        message = client.messages.create(
-            model=os.environ.get("ANTHROPIC_MODEL", "claude-haiku-4-5-20251001"),
-            max_tokens=2048,
-            temperature=0.2,
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_prompt}],
-        )
-    except anthropic.APIError as e:
-        raise RuntimeError(f"Anthropic API error during report generation: {e}") from e
-
-    raw = message.content[0].text
-    match = re.search(r'\{.*\}', raw, re.DOTALL)
-    if not match:
-        raise ValueError(f"No JSON object found in LLM response: {raw!r}")
-    return json.loads(match.group())
+    Acts as a Market Intelligence Analyst: synthesizes pricing data,
+    competitive landscape, and sentiment insights into a structured
+    strategic business report in JSON format.
+    `profile` selects which data goes into the prompt, which sections are
+    requested, and the max_tokens budget. `sentiment_data` may be None when
+    the profile does not focus on sentiment.
+    `timeout` (seconds) bounds the LLM call; exceeding it raises TimeoutError.
+    A report that leaves out a requested section raises ValueError.
+    """
+    with span("prompt_build"):
+        system_prompt, user_prompt = _build_prompts(product_name, market, scraper_data, sentiment_data, profile)
+
+    message = call_llm(
+        _get_client(),
+        "report generation",
+        timeout=timeout,
+        model=os.environ.get("ANTHROPIC_MODEL", "claude-haiku-4-5-20251001"),
+        max_tokens=profile.max_tokens,
+        temperature=0.2,
+        system=system_prompt,
+        messages=[{"role": "user", "content": user_prompt}],
+    )
+
+    with span("parse"):
+        raw = message.content[0].text
+        match = re.search(r'\{.*\}', raw, re.DOTALL)
+        if not match:
+            raise ValueError(f"No JSON object found in LLM response: {raw!r}")
+        report = json.loads(match.group())
+
+    # The sentiment section is never generated: it comes from the sentiment stage
+    requested = ["executive_summary", *profile.sections, "strategic_recommendations"]
+    missing = [
+        section for section in requested if section != "sentiment_analysis" and report.get(section) is None
+    ]
+    if missing:
+        raise ValueError(f"LLM report is missing sections: {', '.join(missing)}")
+    return _merge_known_data(report, scraper_data, sentiment_data, profile)
+
+
+def _merge_known_data(
+    report: dict[str, Any],
+    scraper_data: dict[str, Any],
+    sentiment_data: dict[str, Any] | None,
+    profile: ReportProfile,
+) -> dict[str, Any]:
+    """Complete the narrative sections from the model with the data they describe."""
+    merged = {"executive_summary": report["executive_summary"]}
+    if "pricing" in profile.focus:
+        prices = scraper_data["prices_by_retailer"].values()
+        merged["pricing_analysis"] = {
+            "retailers": scraper_data["retailers"],
+            "prices_by_retailer": scraper_data["prices_by_retailer"],
+            "average_price": scraper_data["average_price"],
+            "price_range": {"min": min(prices), "max": max(prices)},
+            "price_positioning": report["pricing_analysis"]["price_positioning"],
+        }
+    if "competitors" in profile.focus:
+        merged["competitive_landscape"] = {
+            "main_competitors": scraper_data["competitors"],
+            "market_position": report["competitive_landscape"]["market_position"],
+            "competitive_advantages": report["competitive_landscape"]["competitive_advantages"],
+        }
+    if "sentiment" in profile.focus and sentiment_data is not None:
+        merged["sentiment_analysis"] = sentiment_data
+    merged["strategic_recommendations"] = report["strategic_recommendations"]
+    return merged
@@ -3,26 +3,13 @@ import os
 import re
 from typing import Any
 
-import anthropic
+from app.profiling.trace import span
+from app.tools.llm import call_llm
+from app.tools.llm import get_client as _get_client
 
-_client: anthropic.Anthropic | None = None
 
-
-def _get_client() -> anthropic.Anthropic:
-    global _client
-    if _client is None:
-        _client = anthropic.Anthropic(api_key=os.environ.get("ANTHROPIC_API_KEY"))
-    return _client
-
-
-def run_sentiment_analysis(product_name: str, market: str, review_samples: list[str]) -> dict[str, Any]:
-    """
-    LLM-based sentiment analyzer tool.
-
-    Takes customer review samples and extracts structured insights:
-    overall sentiment, strengths, weaknesses, and value positioning.
-    Uses a low temperature for stable, deterministic output.
-    """
+def _build_prompts(product_name: str, market: str, review_samples: list[str]) -> tuple[str, str]:
+    """Build the system and user prompts for the given reviews."""
     reviews_text = "\n".join(f"- {review}" for review in review_samples)
 
     system_prompt = (
@@ -44,21 +31,40 @@ Respond with ONLY valid JSON in this exact format, no markdown, no explanation:
     "weaknesses": ["weakness1", "weakness2"],
     "value_positioning": "budget|mid-range|premium"
 }}"""
+    return system_prompt, user_prompt
 
-    client = _get_client()
-    try:
-        message = client.messages.create(
-            model=os.environ.get("ANTHROPIC_MODEL", "claude-haiku-4-5-20251001"),
-            max_tokens=1024,
-            temperature=0.1,
-            system=system_prompt,
-            messages=[{"role": "user", "content": user_prompt}],
-        )
-    except anthropic.APIError as e:
-        raise RuntimeError(f"Anthropic API error during sentiment analysis: {e}") from e
 
-    raw = message.content[0].text
-    match = re.search(r'\{.*\}', raw, re.DOTALL)
-    if not match:
-        raise ValueError(f"No JSON object found in LLM response: {raw!r}")
-    return json.loads(match.group())
+def run_sentiment_analysis(
+    product_name: str,
+    market: str,
+    review_samples: list[str],
+    timeout: float | None = None,
+) -> dict[str, Any]:
+    """
+    LLM-based sentiment analyzer tool.
+
+    Takes customer review samples and extracts structured insights:
+    overall sentiment, strengths, weaknesses, and value positioning.
+    Uses a low temperature for stable, deterministic output.
+    `timeout` (seconds) bounds the LLM call; exceeding it raises TimeoutError.
+    """
+    with span("prompt_build"):
+        system_prompt, user_prompt = _build_prompts(product_name, market, review_samples)
+
+    message = call_llm(
+        _get_client(),
+        "sentiment analysis",
+        timeout=timeout,
+        model=os.environ.get("ANTHROPIC_MODEL", "claude-haiku-4-5-20251001"),
+        max_tokens=1024,
+        temperature=0.1,
+        system=system_prompt,
+        messages=[{"role": "user", "content": user_prompt}],
+    )
+
+    with span("parse"):
+        raw = message.content[0].text
+        match = re.search(r'\{.*\}', raw, re.DOTALL)
+        if not match:
+            raise ValueError(f"No JSON object found in LLM response: {raw!r}")
+        return json.loads(match.group())
@@ -0,0 +1,293 @@
+import math
+import zlib
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class RetailerProfile:
+    name: str
+    markup: tuple[float, float]         # relative to the product base price
+    stock_chance: float
+    rating: tuple[float, float]
+    review_count: tuple[int, int]
+    shipping: str
+
+
+@dataclass(frozen=True)
+class MarketCatalog:
+    market: str
+    retailers: tuple[RetailerProfile, ...]
+
+
+@dataclass(frozen=True)
+class ProductCatalog:
+    name: str
+    base_price: float
+    category: str
+    competitors: tuple[dict[str, Any], ...]
+    specifications: dict[str, Any]
+    positive_reviews: tuple[str, ...]
+    negative_reviews: tuple[str, ...]
+    positive_share: float = 0.7
+
+
+MARKET_CATALOGS: dict[str, MarketCatalog] = {
+    "canada": MarketCatalog(
+        market="Canada",
+        retailers=(
+            RetailerProfile("Official Store", (0.0, 0.0), 1.0, (4.0, 5.0), (800, 2000), "Free standard shipping"),
+            RetailerProfile("Amazon.ca", (0.012, 0.058), 0.9, (3.8, 4.8), (1000, 5000), "Free with Prime"),
+            RetailerProfile("BestBuy.ca", (0.023, 0.081), 0.8, (3.5, 4.6), (200, 1500), "Free shipping over $35"),
+        ),
+    ),
+}
+
+PRODUCT_CATALOGS: dict[str, ProductCatalog] = {
+    "oura ring gen 3": ProductCatalog(
+        name="Oura Ring Gen 3",
+        base_price=429.99,
+        category="fitness ring",
+        # Real product names, not randomized
+        competitors=(
+            {"name": "Samsung Galaxy Ring", "price_cad": 549.99, "retailer": "BestBuy.ca", "category": "fitness ring"},
+            {"name": "RingConn Smart Ring", "price_cad": 329.99, "retailer": "Amazon.ca", "category": "fitness ring"},
+            {"name": "Ultrahuman Ring AIR", "price_cad": 399.99, "retailer": "Amazon.ca", "category": "fitness ring"},
+        ),
+        specifications={
+            "battery_life": "4-7 days",
+            "water_resistance": "100m",
+            "sensors": ["heart rate", "SpO2", "skin temperature", "accelerometer"],
+            "connectivity": "Bluetooth 5.1",
+            "materials": "Titanium",
+            "weight": "4-6g",
+            "subscription": "Oura Membership (optional, ~CAD $7.99/month)",
+        },
+        positive_reviews=(
+            "The sleep tracking on this ring is incredibly accurate. It's changed how I approach my recovery.",
+            "Comfortable enough to wear 24/7. Battery lasts about 5 days with my usage.",
+            "Best fitness tracker I've owned. The readiness score actually helps me plan my workouts.",
+            "Build quality is exceptional. Titanium feels premium and it's survived everything I've thrown at it.",
+            "The app is intuitive but the monthly fee is a dealbreaker for some. I think it's worth it.",
+            "Ordered from Amazon.ca, arrived quickly and well packaged. No sizing issues with the sizing kit.",
+            "Compared to my previous Fitbit, the Oura Ring data depth is in a different league.",
+            "No GPS and no display might bother some people, but I love the minimalist approach.",
+            "Canadian shipping was fast. Price in CAD is steep but comparable to other premium wearables.",
+            "Honestly surprised by how light it is. I forget I'm wearing it most of the time.",
+            "The HRV tracking has been a game changer for understanding my stress levels.",
+            "Perfect for someone who wants health data without a screen on their wrist.",
+            "Battery life is solid. Charges fast and lasts nearly a week with regular use.",
+            "Sleep stages are more detailed than any smartwatch I've tried. Worth every penny.",
+            "My doctor actually asked about my SpO2 trends after I showed her my Oura data. That's impressive.",
+        ),
+        negative_reviews=(
+            "Great device but the subscription feels like a cash grab after paying $430 already.",
+            "Returned it after a week — the subscription on top of the purchase price was too much for me.",
+            "The sizing kit process was annoying, and even after all that the ring still spins on my finger.",
+            "No display means pulling out my phone for everything. The app is slow to sync, which makes it worse.",
+            "Customer support took over a week to answer when my ring stopped syncing.",
+        ),
+        positive_share=0.75,
+    ),
+}
+
+# Used for products without a catalog entry. "{product}" is replaced by the product name.
+GENERIC_POSITIVE_REVIEWS = (
+    "The {product} does exactly what it promises. Very happy with it.",
+    "Build quality on the {product} is better than I expected for the price.",
+    "Setup took five minutes and the {product} has worked flawlessly since.",
+    "Arrived quickly and well packaged. The {product} feels premium.",
+    "I compared several options and the {product} is the best value in its category.",
+    "Using the {product} daily for a month now, no complaints at all.",
+)
+GENERIC_NEGATIVE_REVIEWS = (
+    "The {product} stopped working properly after a few weeks.",
+    "Too expensive for what the {product} offers compared to alternatives.",
+    "Customer support was slow to answer my questions about the {product}.",
+    "The {product} is fine but the companion app is clunky.",
+)
+GENERIC_COMPETITOR_BRANDS = ("Northline", "Maplewave", "Tundra")
+
+
+@dataclass
+class MarketBatch:
+    """Vectorized market data: row i is product i, column j is retailer j."""
+
+    market: MarketCatalog
+    products: list[ProductCatalog]
+    prices: np.ndarray          # float64, (n_products, n_retailers)
+    in_stock: np.ndarray        # bool
+    ratings: np.ndarray         # float64, one decimal
+    review_counts: np.ndarray   # int64
+    reviews: list[list[str]]    # review_samples per product
+
+    def scraper_payload(self, index: int) -> dict[str, Any]:
+        """Row `index` in the run_scraper output format."""
+        product = self.products[index]
+        retailers = {
+            retailer.name: {
+                "price_cad": float(self.prices[index, j]),
+                "in_stock": bool(self.in_stock[index, j]),
+                "platform_rating": float(self.ratings[index, j]),
+                "review_count": int(self.review_counts[index, j]),
+                "shipping": retailer.shipping,
+            }
+            for j, retailer in enumerate(self.market.retailers)
+        }
+        prices = {shop: data["price_cad"] for shop, data in retailers.items()}
+        return {
+            "product_name": product.name,
+            "market": self.market.market,
+            "retailers": retailers,
+            "prices_by_retailer": prices,
+            "average_price": round(sum(prices.values()) / len(prices), 2),
+            "competitors": [dict(c) for c in product.competitors],
+            "specifications": product.specifications,
+            "review_samples": self.reviews[index],
+        }
+
+
+def _name_uniforms(name: str, count: int) -> list[float]:
+    """Stable pseudo-random numbers in [0, 1) derived from a product name."""
+    data = name.encode()
+    return [zlib.crc32(data, salt) / 2**32 for salt in range(1, count + 1)]
+
+
+@lru_cache(maxsize=16384)
+def generic_catalog(product_name: str) -> ProductCatalog:
+    """
+    Catalog for a product without an entry in PRODUCT_CATALOGS.
+
+    Prices are derived from the name so a product keeps its price level across
+    runs and seeds. Hashing is used instead of a per-name RNG so building
+    thousands of catalogs stays cheap.
+    """
+    u1, u2, *offsets = _name_uniforms(product_name, 2 + len(GENERIC_COMPETITOR_BRANDS))
+    # Box-Muller: lognormal base price centred on CAD $200
+    normal = math.sqrt(-2 * math.log(1 - u1)) * math.cos(2 * math.pi * u2)
+    base_price = round(200 * math.exp(0.6 * normal), 2)
+    suffix = (product_name.split() or ["Alternative"])[-1]
+    return ProductCatalog(
+        name=product_name,
+        base_price=base_price,
+        category="consumer product",
+        competitors=tuple(
+            {
+                "name": f"{brand} {suffix}",
+                "price_cad": round(base_price * (0.7 + 0.6 * offset), 2),
+                "retailer": "Amazon.ca",
+                "category": "consumer product",
+            }
+            for brand, offset in zip(GENERIC_COMPETITOR_BRANDS, offsets)
+        ),
+        specifications={"category": "consumer product", "warranty": "1 year"},
+        positive_reviews=tuple(r.format(product=product_name) for r in GENERIC_POSITIVE_REVIEWS),
+        negative_reviews=tuple(r.format(product=product_name) for r in GENERIC_NEGATIVE_REVIEWS),
+    )
+
+
+class SyntheticMarketGenerator:
+    """
+    Seeded synthetic market data for the mocked scraper, benchmarks and load tests.
+
+    Prices, stock, ratings, review counts and review picks for many products
+    are drawn in a single NumPy call per field. The same seed always yields
+    the same data. Products without a catalog entry get a generic catalog
+    derived from the product name; unknown markets raise ValueError.
+    """
+
+    def __init__(self, seed: int | None = None) -> None:
+        self._rng = np.random.default_rng(seed)
+
+    def generate(
+        self,
+        product_names: list[str],
+        market: str,
+        reviews_per_product: int = 8,
+        positive_share: float | None = None,
+        duplicate_rate: float = 0.0,
+    ) -> MarketBatch:
+        """
+        Generate market data for every product in `product_names`.
+
+        `positive_share` overrides each catalog's share of positive reviews to
+        skew sentiment. `duplicate_rate` replaces that fraction of each
+        product's reviews with copies of its other reviews, as happens with
+        syndicated or spam reviews. Raises ValueError for an empty product list,
+        a negative review count, an unknown market, or a share or rate outside
+        its range.
+        """
+        if not product_names:
+            raise ValueError("product_names must contain at least one product")
+        if reviews_per_product < 0:
+            raise ValueError(f"reviews_per_product must be >= 0, got {reviews_per_product}")
+        if positive_share is not None and not 0.0 <= positive_share <= 1.0:
+            raise ValueError(f"positive_share must be in [0, 1], got {positive_share}")
+        if not 0.0 <= duplicate_rate < 1.0:
+            raise ValueError(f"duplicate_rate must be in [0, 1), got {duplicate_rate}")
+        market_catalog = MARKET_CATALOGS.get(market.strip().lower())
+        if market_catalog is None:
+            raise ValueError(f"No synthetic catalog for market '{market}'. Available: {', '.join(MARKET_CATALOGS)}")
+        products = [
+            PRODUCT_CATALOGS.get(name.strip().lower()) or generic_catalog(name) for name in product_names
+        ]
+        retailers = market_catalog.retailers
+        shape = (len(products), len(retailers))
+
+        base = np.array([p.base_price for p in products])[:, None]
+        markup_lo, markup_hi = np.array([r.markup for r in retailers]).T
+        rating_lo, rating_hi = np.array([r.rating for r in retailers]).T
+        count_lo, count_hi = np.array([r.review_count for r in retailers]).T
+
+        return MarketBatch(
+            market=market_catalog,
+            products=products,
+            prices=np.round(base * (1 + self._rng.uniform(markup_lo, markup_hi, size=shape)), 2),
+            in_stock=self._rng.random(shape) < np.array([r.stock_chance for r in retailers]),
+            ratings=np.round(self._rng.uniform(rating_lo, rating_hi, size=shape), 1),
+            review_counts=self._rng.integers(count_lo, count_hi, size=shape, endpoint=True),
+            reviews=self._reviews(products, reviews_per_product, positive_share, duplicate_rate),
+        )
+
+    def _reviews(
+        self,
+        products: list[ProductCatalog],
+        count: int,
+        positive_share: float | None,
+        duplicate_rate: float,
+    ) -> list[list[str]]:
+        pools = [p.positive_reviews + p.negative_reviews for p in products]
+        weights = np.zeros((len(products), max(len(pool) for pool in pools)))
+        for i, product in enumerate(products):
+            share = product.positive_share if positive_share is None else positive_share
+            n_pos, n_neg = len(product.positive_reviews), len(product.negative_reviews)
+            weights[i, :n_pos] = share / n_pos
+            weights[i, n_pos:n_pos + n_neg] = (1 - share) / n_neg
+
+        if count <= np.count_nonzero(weights, axis=1).min():
+            # Weighted sampling without replacement (Gumbel top-k), so reviews
+            # are unique as long as the pools are large enough
+            with np.errstate(divide="ignore"):
+                keys = np.log(weights) + self._rng.gumbel(size=weights.shape)
+            picks = np.argsort(-keys, axis=1)[:, :count]
+        else:
+            cumulative = weights.cumsum(axis=1)
+            draws = self._rng.random((len(products), count)) * cumulative[:, -1:]
+            picks = (draws[:, :, None] >= cumulative[:, None, :]).sum(axis=2)
+
+        n_duplicates = min(int(round(count * duplicate_rate)), count - 1)
+        if n_duplicates > 0:
+            # Per row: the first n_duplicates of a random permutation are
+            # overwritten with copies of randomly chosen remaining positions
+            order = np.argsort(self._rng.random(picks.shape), axis=1)
+            targets, sources = order[:, :n_duplicates], order[:, n_duplicates:]
+            chosen = np.take_along_axis(
+                sources, self._rng.integers(0, sources.shape[1], size=targets.shape), axis=1
+            )
+            rows = np.arange(len(products))[:, None]
+            picks[rows, targets] = picks[rows, chosen]
+
+        return [[pool[j] for j in row] for pool, row in zip(pools, picks.tolist())]
@@ -0,0 +1,127 @@
+"""
+Cold-start benchmark for autoscaled workers.
+
+Measures, in fresh interpreters:
+- import time of `app.main`, plus the slowest modules from `-X importtime`
+- time until a uvicorn worker answers /health, then until /ready reports ready
+- latency of the first LLM API call made some idle time after warm-up, which
+  is what the first user request pays; past the pool's keep-alive expiry
+  (LLM_KEEPALIVE_SECONDS) the warm-up connection is gone and it reconnects
+
+    python benchmarks/cold_start.py --runs 5 --idle 0 10 60
+"""
+import argparse
+import os
+import re
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def import_time_ms() -> float:
+    code = "import time; t = time.perf_counter(); import app.main; print((time.perf_counter() - t) * 1000)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def slowest_imports(limit: int) -> list[tuple[str, float]]:
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app.main"],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    rows = []
+    for line in out.stderr.splitlines():
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \|( *)(\S+)", line)
+        # Top-level and first-level imports only, so nested modules are not double counted
+        if match and len(match.group(2)) <= 3:
+            rows.append((match.group(3).strip(), int(match.group(1)) / 1000))
+    return sorted(rows, key=lambda row: row[1], reverse=True)[:limit]
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def time_to_ready_ms(timeout: float = 30.0) -> tuple[float, float]:
+    port = _free_port()
+    start = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=ROOT, env={**os.environ}, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    health = ready = None
+    try:
+        while time.perf_counter() - start < timeout and ready is None:
+            try:
+                if health is None and httpx.get(f"http://127.0.0.1:{port}/health").status_code == 200:
+                    health = (time.perf_counter() - start) * 1000
+                if health is not None and httpx.get(f"http://127.0.0.1:{port}/ready").status_code == 200:
+                    ready = (time.perf_counter() - start) * 1000
+            except httpx.TransportError:
+                pass
+            time.sleep(0.01)
+    finally:
+        server.terminate()
+        server.wait()
+    if health is None or ready is None:
+        raise RuntimeError(f"Worker not ready after {timeout}s")
+    return health, ready
+
+
+def first_call_ms(idle_seconds: float) -> tuple[float, float]:
+    """Warm-up connection time, then the latency of a call made `idle_seconds` later."""
+    code = (
+        "import time; from app.tools.llm import get_client, open_connection\n"
+        "get_client()\n"
+        "t = time.perf_counter(); open_connection(); warm = time.perf_counter() - t\n"
+        f"time.sleep({idle_seconds})\n"
+        "t = time.perf_counter(); open_connection(); print(warm * 1000, (time.perf_counter() - t) * 1000)"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    warm, first = out.stdout.strip().splitlines()[-1].split()
+    return float(warm), float(first)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure import time and time-to-ready.")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--skip-server", action="store_true", help="Only measure import time")
+    parser.add_argument(
+        "--idle", type=float, nargs="*", default=[],
+        help="Also time the first LLM call after each idle period (seconds); needs network access",
+    )
+    args = parser.parse_args()
+
+    imports = [import_time_ms() for _ in range(args.runs)]
+    print(f"import app.main: median {statistics.median(imports):.0f}ms over {args.runs} runs")
+    for module, ms in slowest_imports(8):
+        print(f"  {module:<40} {ms:8.1f}ms")
+
+    if not args.skip_server:
+        runs = [time_to_ready_ms() for _ in range(args.runs)]
+        print(f"time to /health: median {statistics.median(r[0] for r in runs):.0f}ms")
+        print(f"time to /ready:  median {statistics.median(r[1] for r in runs):.0f}ms")
+
+    if args.idle:
+        expiry = os.environ.get("LLM_KEEPALIVE_SECONDS", "300")
+        print(f"LLM keep-alive expiry: {expiry}s (SDK default: 5s)")
+    for idle in args.idle:
+        runs = [first_call_ms(idle) for _ in range(args.runs)]
+        print(
+            f"first LLM call after {idle:g}s idle: median {statistics.median(r[1] for r in runs):.0f}ms "
+            f"(warm-up connection: {statistics.median(r[0] for r in runs):.0f}ms)"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
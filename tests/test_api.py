@@ -68,3 +68,51 @@ def test_analyze_returns_500_on_pipeline_failure():
     assert response.status_code == 500
 
 
+def test_analyze_forwards_deadline_to_orchestrator():
+    with patch("app.api.routes.orchestrate", return_value=MOCK_REPORT) as mock_orchestrate:
+        client.post("/analyze", json={"product_name": "Oura Ring Gen 3", "market": "Canada", "deadline_ms": 3000})
+    assert mock_orchestrate.call_args.kwargs["deadline_ms"] == 3000
+
+
+def test_analyze_returns_partial_response():
+    partial = {
+        "executive_summary": None,
+        "pricing_analysis": None,
+        "competitive_landscape": None,
+        "sentiment_analysis": MOCK_REPORT["sentiment_analysis"],
+        "strategic_recommendations": None,
+        "delivery": "partial",
+        "stages": {"scraper": {"source": "fresh"}, "sentiment": {"source": "fresh"}, "report": {"source": "unavailable"}},
+        "unavailable_sections": ["executive_summary", "pricing_analysis", "competitive_landscape", "strategic_recommendations"],
+    }
+    with patch("app.api.routes.orchestrate", return_value=partial):
+        response = client.post("/analyze", json={"product_name": "Oura Ring Gen 3", "market": "Canada", "deadline_ms": 3000})
+    assert response.status_code == 200
+    data = response.json()
+    assert data["delivery"] == "partial"
+    assert data["executive_summary"] is None
+    assert data["stages"]["report"]["source"] == "unavailable"
+
+
+def test_analyze_rejects_unknown_profile():
+    response = client.post("/analyze", json={"product_name": "Oura Ring Gen 3", "market": "Canada", "profile": "nope"})
+    assert response.status_code == 422
+
+
+def test_analyze_passes_selected_profile():
+    with patch("app.api.routes.orchestrate", return_value=MOCK_REPORT) as mock_orchestrate:
+        client.post("/analyze", json={"product_name": "Oura Ring Gen 3", "market": "Canada", "profile": "pricing"})
+    assert mock_orchestrate.call_args.kwargs["profile"].name == "pricing"
+
+
+def test_analyze_queues_evaluation_after_response():
+    with (
+        patch("app.api.routes.orchestrate", return_value=MOCK_REPORT),
+        patch("app.api.routes.evaluation_queue.maybe_enqueue") as mock_enqueue,
+    ):
+        response = client.post("/analyze", json={"product_name": "Oura Ring Gen 3", "market": "Canada"})
+    assert response.status_code == 200
+    args, _ = mock_enqueue.call_args
+    assert args[:2] == ("Oura Ring Gen 3", "Canada")
+    # The serialized response is handed over as-is, not re-dumped on the request path
+    assert args[2] == response.content
@@ -0,0 +1,147 @@
+import json
+import os
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from app.evaluation import replay
+from app.evaluation.judge import collect_judge_batch, parse_judge_response, submit_judge_batch
+from app.evaluation.queue import EvaluationQueue
+from app.evaluation.store import ScoreStore, score_store
+from app.main import app
+
+client = TestClient(app)
+
+JUDGE_OUTPUT = {"actionability": 4, "specificity": 5, "coherence": 4, "faithfulness": 3, "rationale": "Solid."}
+
+ANALYSIS = {
+    "analysis_id": "abc123",
+    "delivery": "complete",
+    "prompt_version": "2",
+    "model": "claude-haiku-4-5-20251001",
+    "profile": "full",
+    "executive_summary": "Strong premium position.",
+    "strategic_recommendations": ["Launch loyalty program"],
+    "sentiment_analysis": None,
+}
+ANALYSIS_JSON = json.dumps(ANALYSIS).encode()
+
+
+def test_parse_judge_response_adds_overall():
+    scores = parse_judge_response(json.dumps(JUDGE_OUTPUT))
+    assert scores["overall"] == 4.0
+    assert scores["rationale"] == "Solid."
+
+
+def test_enqueue_respects_sample_rate(monkeypatch):
+    queue = EvaluationQueue()
+    with patch.object(queue, "_ensure_worker"):
+        monkeypatch.setenv("JUDGE_SAMPLE_RATE", "0")
+        assert queue.maybe_enqueue("Oura Ring Gen 3", "Canada", ANALYSIS_JSON) is False
+        monkeypatch.setenv("JUDGE_SAMPLE_RATE", "1")
+        assert queue.maybe_enqueue("Oura Ring Gen 3", "Canada", ANALYSIS_JSON) is True
+
+
+def test_enqueue_skips_partial_analyses(monkeypatch):
+    monkeypatch.setenv("JUDGE_SAMPLE_RATE", "1")
+    queue = EvaluationQueue()
+    with patch.object(queue, "_ensure_worker"):
+        partial = json.dumps({**ANALYSIS, "delivery": "partial"}).encode()
+        assert queue.maybe_enqueue("Oura Ring Gen 3", "Canada", partial) is False
+
+
+def test_enqueue_drops_sampled_analyses_when_queue_is_full(monkeypatch):
+    monkeypatch.setenv("JUDGE_SAMPLE_RATE", "1")
+    monkeypatch.setenv("JUDGE_MAX_PENDING", "1")
+    queue = EvaluationQueue()
+    with patch.object(queue, "_ensure_worker"):
+        assert queue.maybe_enqueue("Oura Ring Gen 3", "Canada", ANALYSIS_JSON) is True
+        other = json.dumps({**ANALYSIS, "analysis_id": "def456"}).encode()
+        assert queue.maybe_enqueue("Oura Ring Gen 3", "Canada", other) is False
+
+
+def test_flush_submits_and_poll_stores_scores(monkeypatch):
+    monkeypatch.setenv("JUDGE_SAMPLE_RATE", "1")
+    score_store.clear()
+    queue = EvaluationQueue()
+    with patch.object(queue, "_ensure_worker"):
+        queue.maybe_enqueue("Oura Ring Gen 3", "Canada", ANALYSIS_JSON)
+
+    with patch("app.evaluation.queue.submit_judge_batch", return_value="batch_1") as mock_submit:
+        assert queue.flush() == 1
+    items = mock_submit.call_args.args[0]
+    assert "sentiment_analysis" not in items["abc123"]["report"]
+
+    # A batch still processing does not block the worker
+    with patch("app.evaluation.queue.collect_judge_batch", return_value=None):
+        assert queue.poll() == 0
+    assert score_store.get("abc123") is None
+
+    scores = {"abc123": parse_judge_response(json.dumps(JUDGE_OUTPUT))}
+    with patch("app.evaluation.queue.collect_judge_batch", return_value=scores) as mock_collect:
+        assert queue.poll() == 1
+    mock_collect.assert_called_once_with("batch_1")
+    assert score_store.get("abc123")["prompt_version"] == "2"
+    assert score_store.get("abc123")["profile"] == "full"
+    assert queue.poll() == 0
+
+
+def test_judge_batch_submits_and_collects_through_batches_api():
+    entry = MagicMock(custom_id="abc123")
+    entry.result.type = "succeeded"
+    entry.result.message.content = [MagicMock(text=json.dumps(JUDGE_OUTPUT))]
+    with patch("app.evaluation.judge._get_client") as mock_get_client:
+        mock_client = mock_get_client.return_value
+        mock_client.messages.batches.create.return_value = MagicMock(id="batch_1")
+        mock_client.messages.batches.retrieve.return_value = MagicMock(processing_status="in_progress")
+
+        batch_id = submit_judge_batch({"abc123": {"product_name": "Oura Ring Gen 3", "market": "Canada", "report": {}}})
+        assert collect_judge_batch(batch_id) is None
+
+        mock_client.messages.batches.retrieve.return_value = MagicMock(processing_status="ended")
+        mock_client.messages.batches.results.return_value = [entry]
+        scores = collect_judge_batch(batch_id)
+
+    requests = mock_client.messages.batches.create.call_args.kwargs["requests"]
+    assert requests[0]["custom_id"] == "abc123"
+    assert scores["abc123"]["overall"] == 4.0
+
+
+def test_quality_endpoint_returns_rolling_averages_per_profile():
+    score_store.clear()
+    scores = parse_judge_response(json.dumps(JUDGE_OUTPUT))
+    score_store.add("a1", "2", "claude-haiku-4-5-20251001", "full", scores)
+    score_store.add("a2", "2", "claude-haiku-4-5-20251001", "pricing", {**scores, "overall": 2.0})
+    response = client.get("/quality")
+    assert response.status_code == 200
+    data = {group["profile"]: group for group in response.json()}
+    assert data["full"]["prompt_version"] == "2"
+    assert data["full"]["count"] == 1
+    assert data["full"]["averages"]["overall"] == 4.0
+    assert data["pricing"]["averages"]["overall"] == 2.0
+
+
+def test_score_store_keeps_only_recent_analyses():
+    store = ScoreStore(max_analyses=2)
+    scores = parse_judge_response(json.dumps(JUDGE_OUTPUT))
+    for analysis_id in ("a1", "a2", "a3"):
+        store.add(analysis_id, "2", "claude-haiku-4-5-20251001", "full", scores)
+    assert store.get("a1") is None
+    assert store.get("a3") is not None
+    assert store.averages()[0]["count"] == 3
+
+
+def test_quality_for_unknown_analysis_returns_404():
+    score_store.clear()
+    assert client.get("/quality/missing").status_code == 404
+
+
+def test_replay_flags_regression():
+    scores = parse_judge_response(json.dumps(JUDGE_OUTPUT))
+    with (
+        patch.dict(os.environ),
+        patch("app.tools.report.run_report_generator", return_value={}),
+        patch("app.evaluation.judge.judge_report", return_value=scores),
+    ):
+        assert replay.main(["--tolerance", "0.5"]) == 0
+        assert replay.main(["--tolerance", "0.0"]) == 1
@@ -1,7 +1,14 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 from unittest.mock import patch
 
+from app.models.profile import REPORT_PROFILES
 from app.orchestrator.agent import orchestrate
+from app.orchestrator.cache import StageCache, stage_cache
+from app.tools.llm import call_llm
 
 MOCK_SCRAPER = {
     "product_name": "Oura Ring Gen 3",
@@ -59,7 +66,7 @@ def test_orchestrate_calls_all_three_tools():
     ):
         orchestrate("Oura Ring Gen 3", "Canada")
 
-        mock_scraper.assert_called_once_with("Oura Ring Gen 3", "Canada")
+        mock_scraper.assert_called_once_with("Oura Ring Gen 3", "Canada", timeout=None)
         mock_sentiment.assert_called_once()
         mock_report.assert_called_once()
 
@@ -112,3 +119,202 @@ def test_orchestrate_raises_on_report_failure():
     ):
         with pytest.raises(RuntimeError, match="LLM parse error"):
             orchestrate("Oura Ring Gen 3", "Canada")
+
+
+def test_orchestrate_without_deadline_is_complete():
+    with (
+        patch("app.orchestrator.agent.run_scraper", return_value=MOCK_SCRAPER),
+        patch("app.orchestrator.agent.run_sentiment_analysis", return_value=MOCK_SENTIMENT),
+        patch("app.orchestrator.agent.run_report_generator", return_value=MOCK_REPORT),
+    ):
+        result = orchestrate("Oura Ring Gen 3", "Canada")
+
+    assert result["delivery"] == "complete"
+    assert result["unavailable_sections"] == []
+    assert all(status["source"] == "fresh" for status in result["stages"].values())
+
+
+def test_orchestrate_passes_remaining_budget_to_tools():
+    with (
+        patch("app.orchestrator.agent.run_scraper", return_value=MOCK_SCRAPER) as mock_scraper,
+        patch("app.orchestrator.agent.run_sentiment_analysis", return_value=MOCK_SENTIMENT) as mock_sentiment,
+        patch("app.orchestrator.agent.run_report_generator", return_value=MOCK_REPORT) as mock_report,
+    ):
+        orchestrate("Oura Ring Gen 3", "Canada", deadline_ms=5000)
+
+    for mock in (mock_scraper, mock_sentiment, mock_report):
+        assert 0 < mock.call_args.kwargs["timeout"] <= 5.0
+
+
+def test_orchestrate_serves_cached_report_on_timeout():
+    stage_cache.clear()
+    with (
+        patch("app.orchestrator.agent.run_scraper", return_value=MOCK_SCRAPER),
+        patch("app.orchestrator.agent.run_sentiment_analysis", return_value=MOCK_SENTIMENT),
+        patch("app.orchestrator.agent.run_report_generator", return_value=MOCK_REPORT),
+    ):
+        orchestrate("Oura Ring Gen 3", "Canada")
+
+    with (
+        patch("app.orchestrator.agent.run_scraper", return_value=MOCK_SCRAPER),
+        patch("app.orchestrator.agent.run_sentiment_analysis", return_value=MOCK_SENTIMENT),
+        patch("app.orchestrator.agent.run_report_generator", side_effect=TimeoutError("too slow")),
+    ):
+        result = orchestrate("Oura Ring Gen 3", "Canada", deadline_ms=5000)
+
+    assert result["delivery"] == "stale"
+    assert result["stages"]["report"]["source"] == "cache"
+    assert result["stages"]["report"]["age_seconds"] >= 0
+    assert result["executive_summary"] == MOCK_REPORT["executive_summary"]
+
+
+def test_orchestrate_returns_partial_without_cache():
+    stage_cache.clear()
+    with (
+        patch("app.orchestrator.agent.run_scraper", return_value=MOCK_SCRAPER),
+        patch("app.orchestrator.agent.run_sentiment_analysis", return_value=MOCK_SENTIMENT),
+        patch("app.orchestrator.agent.run_report_generator", side_effect=TimeoutError("too slow")),
+    ):
+        result = orchestrate("Oura Ring Gen 3", "Canada", deadline_ms=5000)
+
+    assert result["delivery"] == "partial"
+    assert result["stages"]["report"]["source"] == "unavailable"
+    assert result["sentiment_analysis"] == MOCK_SENTIMENT
+    assert "executive_summary" in result["unavailable_sections"]
+    assert "sentiment_analysis" not in result["unavailable_sections"]
+
+
+def test_orchestrate_retries_stage_after_cached_fallback():
+    stage_cache.clear()
+    stage_cache.put("report", "Oura Ring Gen 3", "Canada", MOCK_REPORT, variant="full")
+    with (
+        patch("app.orchestrator.agent.run_scraper", return_value=MOCK_SCRAPER),
+        patch("app.orchestrator.agent.run_sentiment_analysis", return_value=MOCK_SENTIMENT),
+        patch("app.orchestrator.agent.run_report_generator", return_value=MOCK_REPORT) as mock_report,
+    ):
+        for _ in range(3):
+            result = orchestrate("Oura Ring Gen 3", "Canada", deadline_ms=8000)
+
+    # A cached result never stops the LLM from being tried while budget remains
+    assert mock_report.call_count == 3
+    assert result["stages"]["report"]["source"] == "fresh"
+    assert result["delivery"] == "complete"
+
+
+def test_orchestrate_serves_cached_report_when_sentiment_is_unavailable():
+    stage_cache.clear()
+    stage_cache.put("report", "Oura Ring Gen 3", "Canada", MOCK_REPORT, variant="full")
+    with (
+        patch("app.orchestrator.agent.run_scraper", return_value=MOCK_SCRAPER),
+        patch("app.orchestrator.agent.run_sentiment_analysis", side_effect=TimeoutError("too slow")),
+        patch("app.orchestrator.agent.run_report_generator") as mock_report,
+    ):
+        result = orchestrate("Oura Ring Gen 3", "Canada", deadline_ms=5000)
+
+    mock_report.assert_not_called()
+    assert result["stages"]["sentiment"]["source"] == "unavailable"
+    assert result["stages"]["report"]["source"] == "cache"
+    assert result["delivery"] == "stale"
+    assert result["sentiment_analysis"] == MOCK_SENTIMENT
+
+
+def test_orchestrate_serves_cached_stages_when_scraper_is_unavailable():
+    stage_cache.clear()
+    stage_cache.put("sentiment", "Oura Ring Gen 3", "Canada", MOCK_SENTIMENT)
+    with (
+        patch("app.orchestrator.agent.run_scraper", side_effect=TimeoutError("too slow")),
+        patch("app.orchestrator.agent.run_sentiment_analysis") as mock_sentiment,
+        patch("app.orchestrator.agent.run_report_generator") as mock_report,
+    ):
+        result = orchestrate("Oura Ring Gen 3", "Canada", deadline_ms=5000)
+
+    mock_sentiment.assert_not_called()
+    mock_report.assert_not_called()
+    assert result["stages"]["sentiment"]["source"] == "cache"
+    assert result["stages"]["report"]["source"] == "unavailable"
+    assert result["delivery"] == "partial"
+    assert result["sentiment_analysis"] == MOCK_SENTIMENT
+
+
+def test_stage_cache_evicts_least_recently_used():
+    cache = StageCache(max_entries=2)
+    cache.put("report", "A", "Canada", {"n": 1})
+    cache.put("report", "B", "Canada", {"n": 2})
+    cache.get("report", "A", "Canada")
+    cache.put("report", "C", "Canada", {"n": 3})
+
+    assert cache.get("report", "B", "Canada") is None
+    assert cache.get("report", "A", "Canada").value == {"n": 1}
+    assert cache.get("report", "C", "Canada").value == {"n": 3}
+
+
+def test_orchestrate_propagates_timeout_without_deadline():
+    with (
+        patch("app.orchestrator.agent.run_scraper", return_value=MOCK_SCRAPER),
+        patch("app.orchestrator.agent.run_sentiment_analysis", side_effect=TimeoutError("too slow")),
+    ):
+        with pytest.raises(TimeoutError):
+            orchestrate("Oura Ring Gen 3", "Canada")
+
+
+def test_orchestrate_pricing_profile_skips_sentiment():
+    with (
+        patch("app.orchestrator.agent.run_scraper", return_value=MOCK_SCRAPER),
+        patch("app.orchestrator.agent.run_sentiment_analysis") as mock_sentiment,
+        patch("app.orchestrator.agent.run_report_generator", return_value=MOCK_REPORT) as mock_report,
+    ):
+        result = orchestrate("Oura Ring Gen 3", "Canada", profile=REPORT_PROFILES["pricing"])
+
+    mock_sentiment.assert_not_called()
+    args, kwargs = mock_report.call_args
+    assert args[3] is None
+    assert kwargs["profile"].name == "pricing"
+    assert result["stages"]["sentiment"]["source"] == "skipped"
+    assert result["omitted_sections"] == ["sentiment_analysis"]
+    assert "sentiment_analysis" not in result
+    assert result["delivery"] == "complete"
+
+
+class _SlowHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        time.sleep(3)
+        self.send_response(200)
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def slow_llm_client():
+    import anthropic
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield anthropic.Anthropic(api_key="test", base_url=f"http://127.0.0.1:{server.server_port}")
+    server.shutdown()
+
+
+def test_orchestrate_deadline_bounds_wall_clock_time(slow_llm_client):
+    def slow_sentiment(product_name, market, review_samples, timeout=None):
+        call_llm(
+            slow_llm_client, "sentiment analysis", timeout=timeout,
+            model="claude-haiku-4-5-20251001", max_tokens=16, messages=[{"role": "user", "content": "hi"}],
+        )
+
+    stage_cache.clear()
+    start = time.monotonic()
+    with (
+        patch("app.orchestrator.agent.run_scraper", return_value=MOCK_SCRAPER),
+        patch("app.orchestrator.agent.run_sentiment_analysis", side_effect=slow_sentiment),
+        patch("app.orchestrator.agent.run_report_generator") as mock_report,
+    ):
+        result = orchestrate("Oura Ring Gen 3", "Canada", deadline_ms=500)
+    elapsed = time.monotonic() - start
+
+    # SDK retries on timeout would take about three times the budget
+    assert elapsed < 0.9
+    assert result["delivery"] == "partial"
+    assert result["stages"]["sentiment"]["source"] == "unavailable"
+    mock_report.assert_not_called()
@@ -0,0 +1,97 @@
+from unittest.mock import MagicMock, patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.profiling.trace import create_message, profiled, span
+from tests.test_api import MOCK_REPORT
+from tests.test_orchestrator import MOCK_SCRAPER, MOCK_SENTIMENT
+
+client = TestClient(app)
+
+
+def _patch_tools():
+    return (
+        patch("app.orchestrator.agent.run_scraper", return_value=MOCK_SCRAPER),
+        patch("app.orchestrator.agent.run_sentiment_analysis", return_value=MOCK_SENTIMENT),
+        patch("app.orchestrator.agent.run_report_generator", return_value=MOCK_REPORT),
+    )
+
+
+def test_span_is_shared_noop_when_not_profiled():
+    assert span("a") is span("b")
+
+
+def test_profiled_records_nested_spans():
+    with profiled() as trace:
+        with span("stage"):
+            with span("parse"):
+                pass
+
+    summary = trace.summary()
+    assert [s["name"] for s in summary["spans"]] == ["stage", "parse"]
+    assert [s["depth"] for s in summary["spans"]] == [1, 2]
+    assert trace.server_timing().startswith("stage;dur=")
+
+
+def test_create_message_streams_only_when_measuring_ttft():
+    mock_client = MagicMock()
+    create_message(mock_client, model="m")
+    with profiled() as trace:
+        create_message(mock_client, model="m")
+    assert mock_client.messages.create.call_count == 2
+    mock_client.messages.stream.assert_not_called()
+    assert [s.name for s in trace.spans] == ["network"]
+
+    stream = mock_client.messages.stream.return_value.__enter__.return_value
+    stream.text_stream = iter(["{", "}"])
+    with profiled(measure_ttft=True) as trace:
+        message = create_message(mock_client, model="m")
+
+    assert message is stream.get_final_message.return_value
+    assert {s.name for s in trace.spans} == {"network", "time_to_first_token"}
+
+
+def test_concurrent_cprofile_is_skipped_not_raised():
+    with profiled(with_cprofile=True) as outer:
+        with profiled(with_cprofile=True) as inner:
+            pass
+    assert outer.cprofile_status == "captured"
+    assert inner.cprofile_status == "busy"
+    assert inner.cprofile_stats is None
+
+    # The profiler is released once the first request is done
+    with profiled(with_cprofile=True) as again:
+        pass
+    assert again.cprofile_status == "captured"
+
+
+def test_analyze_without_profile_has_no_timing_header():
+    p1, p2, p3 = _patch_tools()
+    with p1, p2, p3:
+        response = client.post("/analyze", json={"product_name": "Oura Ring Gen 3", "market": "Canada"})
+    assert "server-timing" not in response.headers
+    assert "x-profile-id" not in response.headers
+
+
+def test_analyze_with_profile_returns_trace():
+    p1, p2, p3 = _patch_tools()
+    with p1, p2, p3:
+        response = client.post(
+            "/analyze?profile=1&cprofile=1", json={"product_name": "Oura Ring Gen 3", "market": "Canada"}
+        )
+    assert response.status_code == 200
+    timing = response.headers["server-timing"]
+    for stage in ("scraper", "sentiment", "report", "validate"):
+        assert f"{stage};dur=" in timing
+
+    assert response.headers["x-profile-cprofile"] == "captured"
+    trace_id = response.headers["x-profile-id"]
+    summary = client.get(f"/profiles/{trace_id}").json()
+    assert summary["cprofile"]
+    chrome = client.get(f"/profiles/{trace_id}/chrome-trace").json()
+    assert {event["name"] for event in chrome["traceEvents"]} >= {"scraper", "report"}
+
+
+def test_unknown_profile_returns_404():
+    assert client.get("/profiles/missing").status_code == 404
@@ -1,7 +1,12 @@
 import json
+import re
+from pathlib import Path
+
+import pytest
 from unittest.mock import MagicMock, patch
 
-from app.tools.report import run_report_generator
+from app.models.profile import REPORT_PROFILES
+from app.tools.report import _build_prompts, run_report_generator
 
 MOCK_SCRAPER = {
     "retailers": {
@@ -70,3 +75,73 @@ def test_report_calls_llm_with_product_and_market():
         assert "Canada" in prompt
 
 
+def test_report_pricing_profile_scopes_prompt_and_tokens():
+    with patch("app.tools.report._get_client") as mock_get_client:
+        mock_client = MagicMock()
+        mock_client.messages.create.return_value = _mock_message(MOCK_REPORT)
+        mock_get_client.return_value = mock_client
+
+        run_report_generator("Oura Ring Gen 3", "Canada", MOCK_SCRAPER, None, profile=REPORT_PROFILES["pricing"])
+
+        call_kwargs = mock_client.messages.create.call_args.kwargs
+        prompt = call_kwargs["messages"][0]["content"]
+        assert "Pricing Data" in prompt
+        assert "Sentiment Analysis Results" not in prompt
+        assert "Product Specifications" not in prompt
+        assert '"sentiment_analysis"' not in prompt
+        assert call_kwargs["max_tokens"] == REPORT_PROFILES["pricing"].max_tokens
+
+
+def test_report_missing_requested_section_raises_value_error():
+    incomplete = {key: value for key, value in MOCK_REPORT.items() if key != "competitive_landscape"}
+    with patch("app.tools.report._get_client") as mock_get_client:
+        mock_get_client.return_value.messages.create.return_value = _mock_message(incomplete)
+
+        with pytest.raises(ValueError, match="competitive_landscape"):
+            run_report_generator("Oura Ring Gen 3", "Canada", MOCK_SCRAPER, MOCK_SENTIMENT)
+
+
+SAMPLE_REPORT = json.loads((Path(__file__).resolve().parents[1] / "examples" / "sample_report.json").read_text())
+
+
+def _fill_template(template: dict, sample: dict) -> dict:
+    """Fill every field the prompt asks for with text from a real (detailed) report."""
+    filled = {}
+    for key, value in template.items():
+        if isinstance(value, dict):
+            filled[key] = _fill_template(value, sample[key])
+        elif isinstance(value, list):
+            filled[key] = sample[key][:len(value)]
+        else:
+            filled[key] = sample[key]
+    return filled
+
+
+@pytest.mark.parametrize("profile", REPORT_PROFILES.values(), ids=lambda p: p.name)
+def test_report_max_tokens_covers_requested_output(profile):
+    _, user_prompt = _build_prompts("Oura Ring Gen 3", "Canada", MOCK_SCRAPER, MOCK_SENTIMENT, profile)
+    template = user_prompt.split("no explanation:\n", 1)[1]
+    template = json.loads(re.sub(r'"<[^>]*>"', '""', template))
+
+    output = json.dumps(_fill_template(template, SAMPLE_REPORT))
+    # About 4 characters per token for English JSON; 3.5 keeps a margin
+    assert len(output) / 3.5 <= profile.max_tokens
+    assert '"retailers"' not in user_prompt.split("no explanation:", 1)[1]
+
+
+def test_report_merges_known_data_into_narrative():
+    narrative = {
+        "executive_summary": MOCK_REPORT["executive_summary"],
+        "pricing_analysis": {"price_positioning": "Premium."},
+        "competitive_landscape": {"market_position": "Leader.", "competitive_advantages": ["Sleep tracking"]},
+        "strategic_recommendations": ["Launch loyalty program"],
+    }
+    with patch("app.tools.report._get_client") as mock_get_client:
+        mock_get_client.return_value.messages.create.return_value = _mock_message(narrative)
+
+        result = run_report_generator("Oura Ring Gen 3", "Canada", MOCK_SCRAPER, MOCK_SENTIMENT)
+
+    assert result["pricing_analysis"]["retailers"] == MOCK_SCRAPER["retailers"]
+    assert result["pricing_analysis"]["price_range"] == {"min": 449.99, "max": 449.99}
+    assert result["competitive_landscape"]["main_competitors"] == MOCK_SCRAPER["competitors"]
+    assert result["sentiment_analysis"] == MOCK_SENTIMENT
@@ -0,0 +1,96 @@
+import hashlib
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.reports.store import report_store
+from tests.test_api import MOCK_REPORT
+
+client = TestClient(app)
+
+PAYLOAD = {"product_name": "Oura Ring Gen 3", "market": "Canada"}
+
+
+def _analyze(analysis_id: str, delivery: str = "complete"):
+    result = {**MOCK_REPORT, "analysis_id": analysis_id, "delivery": delivery}
+    with patch("app.api.routes.orchestrate", return_value=result):
+        response = client.post("/analyze", json=PAYLOAD)
+    assert response.status_code == 200
+    return response
+
+
+def setup_function():
+    report_store.clear()
+
+
+def test_analyze_stores_report_with_content_hash_etag():
+    response = _analyze("a1")
+    digest = hashlib.sha256(response.content).hexdigest()[:32]
+    assert response.headers["etag"] == f'"{digest}"'
+
+    stored = client.get("/reports/a1", headers={"Accept-Encoding": "identity"})
+    assert stored.status_code == 200
+    assert stored.content == response.content
+    assert stored.headers["etag"] == f'"{digest}"'
+
+
+def test_latest_report_is_gzipped_and_never_runs_pipeline():
+    _analyze("a1")
+    with patch("app.api.routes.orchestrate") as mock_orchestrate:
+        response = client.get("/reports/latest/oura ring gen 3/canada", headers={"Accept-Encoding": "gzip"})
+    mock_orchestrate.assert_not_called()
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].endswith('-gzip"')
+    assert response.json()["analysis_id"] == "a1"
+
+
+def test_matching_if_none_match_returns_304():
+    _analyze("a1")
+    first = client.get("/reports/latest/Oura Ring Gen 3/Canada")
+    second = client.get("/reports/latest/Oura Ring Gen 3/Canada", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == first.headers["etag"]
+
+
+def test_if_none_match_only_matches_the_served_encoding():
+    _analyze("a1")
+    gzipped = client.get("/reports/a1", headers={"Accept-Encoding": "gzip"})
+    response = client.get(
+        "/reports/a1", headers={"Accept-Encoding": "identity", "If-None-Match": gzipped.headers["etag"]}
+    )
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+    assert response.headers["etag"] != gzipped.headers["etag"]
+
+
+def test_stale_etag_returns_new_report():
+    _analyze("a1")
+    response = client.get("/reports/a1", headers={"If-None-Match": '"outdated"'})
+    assert response.status_code == 200
+
+
+def test_partial_analysis_does_not_replace_latest():
+    _analyze("a1")
+    _analyze("a2", delivery="partial")
+    assert client.get("/reports/latest/Oura Ring Gen 3/Canada").json()["analysis_id"] == "a1"
+    assert client.get("/reports/a2").json()["delivery"] == "partial"
+
+
+def test_latest_report_is_selected_by_report_profile():
+    _analyze("a1")
+    result = {**MOCK_REPORT, "analysis_id": "a2"}
+    with patch("app.api.routes.orchestrate", return_value=result):
+        client.post("/analyze", json={**PAYLOAD, "profile": "pricing"})
+
+    path = "/reports/latest/Oura Ring Gen 3/Canada"
+    assert client.get(path).json()["analysis_id"] == "a1"
+    assert client.get(path, params={"report_profile": "pricing"}).json()["analysis_id"] == "a2"
+    assert client.get(path, params={"report_profile": "executive"}).status_code == 404
+
+
+def test_unknown_report_returns_404():
+    assert client.get("/reports/missing").status_code == 404
+    assert client.get("/reports/latest/Oura Ring Gen 3/Canada").status_code == 404
@@ -1,4 +1,5 @@
 import json
+import pytest
 from unittest.mock import MagicMock, patch
 
 from app.tools.sentiment import run_sentiment_analysis
@@ -68,3 +69,18 @@ def test_sentiment_calls_llm_with_reviews():
         prompt = call_kwargs.kwargs["messages"][0]["content"]
         assert "Oura Ring Gen 3" in prompt
         assert SAMPLE_REVIEWS[0] in prompt
+
+
+def test_sentiment_maps_api_timeout_to_timeout_error():
+    import anthropic
+
+    with patch("app.tools.sentiment._get_client") as mock_get_client:
+        mock_client = mock_get_client.return_value
+        bounded = mock_client.with_options.return_value
+        bounded.messages.create.side_effect = anthropic.APITimeoutError(request=MagicMock())
+
+        with pytest.raises(TimeoutError):
+            run_sentiment_analysis("Oura Ring Gen 3", SAMPLE_MARKET, SAMPLE_REVIEWS, timeout=0.5)
+
+    # The budget covers the whole call, so the SDK must not retry within it
+    mock_client.with_options.assert_called_once_with(timeout=0.5, max_retries=0)
@@ -0,0 +1,98 @@
+import subprocess
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.startup import Readiness, warm_up
+from app.tools.llm import _http_client
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def test_importing_app_does_not_load_heavy_modules():
+    code = "import sys, app.main; print('anthropic' in sys.modules, 'numpy' in sys.modules)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "False False"
+
+
+def test_ready_returns_503_until_warm_up_finishes():
+    state = Readiness()
+    with patch("app.main.readiness", state):
+        client = TestClient(app)
+        assert client.get("/health").status_code == 200
+        response = client.get("/ready")
+        assert response.status_code == 503
+        assert response.json()["status"] == "starting"
+
+        state.mark_ready({"llm_connection": "open"})
+        response = client.get("/ready")
+        assert response.status_code == 200
+        assert response.json() == {"status": "ready", "llm_connection": "open"}
+
+
+def test_warm_up_builds_client_and_opens_connection():
+    state = Readiness()
+    with (
+        patch("app.startup.readiness", state),
+        patch("app.tools.llm.get_client") as mock_get_client,
+        patch("app.tools.llm.open_connection", return_value=True) as mock_open,
+    ):
+        warm_up()
+
+    mock_get_client.assert_called_once()
+    mock_open.assert_called_once()
+    assert state.is_ready
+    assert state.status()["llm_connection"] == "open"
+
+
+def test_warm_up_marks_ready_even_if_connection_fails():
+    state = Readiness()
+    with (
+        patch("app.startup.readiness", state),
+        patch("app.tools.llm.get_client"),
+        patch("app.tools.llm.open_connection", return_value=False),
+    ):
+        warm_up()
+
+    assert state.status()["llm_connection"] == "failed"
+
+
+def test_warm_up_marks_ready_even_if_scraper_fails():
+    state = Readiness()
+    with (
+        patch("app.startup.readiness", state),
+        patch("app.tools.scraper.run_scraper", side_effect=RuntimeError("boom")),
+    ):
+        warm_up()
+
+    assert state.is_ready
+    assert state.status()["llm_connection"] == "failed"
+    assert "boom" in state.status()["error"]
+
+
+def test_shared_client_keeps_idle_connections_longer(monkeypatch):
+    import anthropic
+
+    monkeypatch.setenv("LLM_KEEPALIVE_SECONDS", "120")
+    with patch("anthropic.DefaultHttpxClient") as mock_http_client:
+        _http_client()
+
+    limits = mock_http_client.call_args.kwargs["limits"]
+    # The SDK default (5s) would drop the warm-up connection before most first requests
+    assert limits.keepalive_expiry == 120.0
+    assert limits.max_connections == anthropic.DEFAULT_CONNECTION_LIMITS.max_connections
+
+
+def test_lifespan_starts_warm_up():
+    state = Readiness()
+    with (
+        patch("app.main.readiness", state),
+        patch("app.main.warm_up", side_effect=lambda: state.mark_ready({})) as mock_warm_up,
+    ):
+        with TestClient(app) as client:
+            assert state.wait(timeout=5)
+            assert client.get("/ready").status_code == 200
+    mock_warm_up.assert_called_once()
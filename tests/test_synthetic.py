@@ -0,0 +1,72 @@
+import pytest
+
+from app.tools.scraper import run_scraper
+from app.tools.synthetic import PRODUCT_CATALOGS, SyntheticMarketGenerator
+
+
+def test_same_seed_gives_same_data():
+    assert run_scraper("Oura Ring Gen 3", "Canada", seed=42) == run_scraper("Oura Ring Gen 3", "Canada", seed=42)
+
+
+def test_different_seeds_give_different_prices():
+    first = run_scraper("Oura Ring Gen 3", "Canada", seed=1)
+    second = run_scraper("Oura Ring Gen 3", "Canada", seed=2)
+    assert first["prices_by_retailer"] != second["prices_by_retailer"]
+
+
+def test_unknown_product_gets_generic_catalog():
+    result = run_scraper("Widget Pro", "Canada", seed=7)
+    assert len(result["competitors"]) >= 1
+    assert all(isinstance(c["price_cad"], float) for c in result["competitors"])
+    assert all("Widget Pro" in review for review in result["review_samples"])
+
+
+def test_unknown_market_raises_value_error():
+    with pytest.raises(ValueError, match="No synthetic catalog"):
+        run_scraper("Oura Ring Gen 3", "USA")
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"product_names": []}, "at least one product"),
+        ({"reviews_per_product": -3}, "reviews_per_product"),
+        ({"positive_share": 1.5}, "positive_share"),
+        ({"positive_share": -0.1}, "positive_share"),
+        ({"duplicate_rate": 1.0}, "duplicate_rate"),
+    ],
+)
+def test_generate_rejects_invalid_arguments(kwargs, message):
+    args = {"product_names": ["Oura Ring Gen 3"], "market": "Canada", **kwargs}
+    with pytest.raises(ValueError, match=message):
+        SyntheticMarketGenerator(seed=0).generate(**args)
+
+
+def test_generate_batch_shapes():
+    batch = SyntheticMarketGenerator(seed=0).generate([f"Product {i}" for i in range(1000)], "Canada")
+    assert batch.prices.shape == (1000, 3)
+    assert batch.in_stock.dtype == bool
+    assert ((batch.ratings >= 0) & (batch.ratings <= 5)).all()
+    assert len(batch.reviews) == 1000
+    assert batch.scraper_payload(999)["product_name"] == "Product 999"
+
+
+def test_reviews_are_unique_without_duplicate_rate():
+    batch = SyntheticMarketGenerator(seed=0).generate(["Oura Ring Gen 3"] * 50, "Canada", reviews_per_product=8)
+    assert all(len(set(reviews)) == 8 for reviews in batch.reviews)
+
+
+def test_duplicate_rate_injects_duplicates():
+    batch = SyntheticMarketGenerator(seed=0).generate(
+        ["Oura Ring Gen 3"] * 50, "Canada", reviews_per_product=10, duplicate_rate=0.3
+    )
+    assert all(len(set(reviews)) < 10 for reviews in batch.reviews)
+
+
+def test_positive_share_skews_sentiment():
+    negative = set(PRODUCT_CATALOGS["oura ring gen 3"].negative_reviews)
+    batch = SyntheticMarketGenerator(seed=0).generate(
+        ["Oura Ring Gen 3"] * 100, "Canada", reviews_per_product=40, positive_share=0.1
+    )
+    reviews = [review for product_reviews in batch.reviews for review in product_reviews]
+    assert sum(review in negative for review in reviews) / len(reviews) > 0.7